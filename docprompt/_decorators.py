@@ -5,6 +5,24 @@ from typing import Callable, Tuple, Type
 from docprompt.utils.async_utils import to_thread
 
 
+def _async_wrapper(sync_method: Callable) -> Callable:
+    # Built in its own scope so each wrapper holds on to its own method, rather than
+    # whichever method the enclosing loop saw last
+    @wraps(sync_method)
+    async def async_wrapper(*args, **kwargs):
+        return await to_thread(sync_method, *args, **kwargs)
+
+    return async_wrapper
+
+
+def _sync_wrapper(async_method: Callable) -> Callable:
+    @wraps(async_method)
+    def sync_wrapper(*args, **kwargs):
+        return asyncio.run(async_method(*args, **kwargs))
+
+    return sync_wrapper
+
+
 def flexible_methods(*method_groups: Tuple[str, str]):
     def decorator(cls: Type):
         def get_method(cls: Type, name: str) -> Callable:
@@ -48,20 +66,10 @@ def flexible_methods(*method_groups: Tuple[str, str]):
                     )
 
                 if sync_method and not async_method:
-
-                    @wraps(sync_method)
-                    async def async_wrapper(*args, **kwargs):
-                        return await to_thread(sync_method, *args, **kwargs)
-
-                    setattr(cls, async_name, async_wrapper)
+                    setattr(cls, async_name, _async_wrapper(sync_method))
 
                 elif async_method and not sync_method:
-
-                    @wraps(async_method)
-                    def sync_wrapper(*args, **kwargs):
-                        return asyncio.run(async_method(*args, **kwargs))
-
-                    setattr(cls, sync_name, sync_wrapper)
+                    setattr(cls, sync_name, _sync_wrapper(async_method))
 
             if errors:
                 raise TypeError("\n".join(errors))
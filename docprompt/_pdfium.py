@@ -38,6 +38,10 @@ PDFIUM_RASTERIZE_LOCK = (
     Lock()
 )  # Rasterization fails without this lock in threaded environments
 
+# Below this many pages, spawning workers (each re-importing docprompt and reopening the PDF)
+# costs more than rendering the pages in-process
+MIN_PAGES_FOR_PROCESS_POOL = 4
+
 
 @contextmanager
 def get_pdfium_document(
@@ -194,15 +198,38 @@ def rasterize_pdf_with_pdfium(
     *,
     return_mode: Literal["pil", "bytes"] = "pil",
     post_process_fn: Optional[Callable[[Image.Image], Image.Image]] = None,
+    page_numbers: Optional[Iterable[int]] = None,
     **kwargs,
 ) -> List[Union[Image.Image, bytes]]:
     """
     Rasterizes an entire PDF using PDFium and a pool of workers
-    """
-    with get_pdfium_document(fp, password=password) as pdf:
-        total_pages = len(pdf)
 
-    max_workers = min(mp.cpu_count(), total_pages)
+    If `page_numbers` (one-indexed) is provided, only those pages are rendered and the
+    results are returned in the same order. A few pages are rendered in-process instead
+    """
+    if page_numbers is None:
+        with get_pdfium_document(fp, password=password) as pdf:
+            page_indices = list(range(len(pdf)))
+    else:
+        page_indices = [page_number - 1 for page_number in page_numbers]
+
+    if not page_indices:
+        return []
+
+    if len(page_indices) < MIN_PAGES_FOR_PROCESS_POOL:
+        with get_pdfium_document(fp, password=password) as pdf:
+            return [
+                _render_job(
+                    i,
+                    pdf,
+                    kwargs,
+                    return_mode=return_mode,
+                    post_process_fn=post_process_fn,
+                )
+                for i in page_indices
+            ]
+
+    max_workers = min(mp.cpu_count(), len(page_indices))
 
     ctx = mp.get_context("spawn")
 
@@ -223,9 +250,7 @@ def rasterize_pdf_with_pdfium(
             initargs=initargs,
             mp_context=ctx,
         ) as executor:
-            results = executor.map(
-                _render_parallel_job, range(total_pages), chunksize=1
-            )
+            results = executor.map(_render_parallel_job, page_indices, chunksize=1)
 
         return list(results)
 
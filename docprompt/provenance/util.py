@@ -2,7 +2,7 @@ import re
 from collections import defaultdict
 from typing import Any, Iterable, List, Optional
 
-from rapidfuzz import fuzz
+from rapidfuzz import fuzz, process
 from rapidfuzz.utils import default_process
 
 from docprompt.schema.layout import NormBBox, TextBlock
@@ -122,10 +122,21 @@ def refine_block_to_word_level(
         last_word = tokenized_query[-1]
 
         for token in tokenized_query:
-            fuzzified_token = default_process(token)
-            for i, word_level_block in enumerate(intersecting_word_level_blocks):
-                if fuzz.ratio(fuzzified_token, fuzzified_word_level_texts[i]) > 87.5:
-                    token_block_mapping[token].add(i)
+            if token in token_block_mapping:
+                continue
+
+            # Score the token against every word in one call, so the comparisons run in
+            # rapidfuzz's native loop rather than one Python-level call per word
+            matches = process.extract(
+                default_process(token),
+                fuzzified_word_level_texts,
+                scorer=fuzz.ratio,
+                processor=None,
+                score_cutoff=87.5,
+                limit=None,
+            )
+
+            token_block_mapping[token] = {i for _, score, i in matches if score > 87.5}
 
         graph = networkx.DiGraph()
         prev = tokenized_query[0]
@@ -72,8 +72,10 @@ def resize_image_to_closest_aspect_ratio(
     *,
     resize_mode: ResizeModes = "thumbnail",
 ) -> Image.Image:
+    from_bytes = False
     if isinstance(image, bytes):
         image = Image.open(BytesIO(image))
+        from_bytes = True
 
     original_width, original_height = image.size
 
@@ -92,7 +94,9 @@ def resize_image_to_closest_aspect_ratio(
         return image
 
     if resize_mode == "thumbnail":
-        image = image.copy()
+        if not from_bytes:
+            image = image.copy()
+
         image.thumbnail(
             (closest_aspect_ratio.max_width, closest_aspect_ratio.max_height)
         )
@@ -119,8 +123,12 @@ def resize_image_to_fize_size_limit(
     if resize_step_size <= 0 or resize_step_size >= 0.5:
         raise ValueError("resize_step_size must be between 0 and 0.5")
 
+    # Only a caller's image needs copying before `thumbnail` shrinks it in place. One we
+    # decoded or converted here is already private, and `resize` never mutates
+    owns_image = False
     if isinstance(image, bytes):
         image = load_image_from_bytes(image)
+        owns_image = True
 
     estimated_bytes = estimate_png_byte_size(image)
 
@@ -130,16 +138,22 @@ def resize_image_to_fize_size_limit(
     # Convert image to the desired mode if it has multiple channels
     if allow_channel_reduction and image.mode in ["LA", "RGBA"]:
         image = image.convert(image_convert_mode)
+        owns_image = True
 
         if estimate_png_byte_size(image) < max_file_size_bytes:
             return image
 
     step_count = 0
-    working_image = image.copy()
+    original_width, original_height = image.size
+
+    if owns_image or resize_mode != "thumbnail":
+        working_image = image
+    else:
+        working_image = image.copy()
 
     while estimated_bytes > max_file_size_bytes:
-        new_width = int(image.width * (1 - resize_step_size * step_count))
-        new_height = int(image.height * (1 - resize_step_size * step_count))
+        new_width = int(original_width * (1 - resize_step_size * step_count))
+        new_height = int(original_height * (1 - resize_step_size * step_count))
 
         if new_width <= 200 or new_height <= 200:
             logger.warning(
@@ -7,9 +7,10 @@ from datetime import datetime
 from functools import cached_property, partial
 from os import PathLike
 from pathlib import Path
-from typing import Dict, Generator, Iterable, Literal, Optional, Tuple, Union
+from typing import Dict, Generator, Iterable, List, Literal, Optional, Tuple, Union
 
 import filetype
+from PIL import Image
 from pydantic import (
     BaseModel,
     Field,
@@ -260,11 +261,64 @@ class PdfDocument(BaseModel):
         quantize_color_count: int = 8,
         return_mode: Literal["pil", "bytes"] = "bytes",
         render_grayscale: bool = False,
-    ) -> Dict[int, bytes]:
+    ) -> Dict[int, Union[bytes, Image.Image]]:
         """
         Rasterizes the entire document using Pdfium
+
+        The result is keyed by page number. Use `rasterize_pdf_pages` for a list instead.
+        """
+        rastered = self.rasterize_pdf_pages(
+            None,
+            dpi=dpi,
+            downscale_size=downscale_size,
+            resize_mode=resize_mode,
+            max_file_size_bytes=max_file_size_bytes,
+            resize_aspect_ratios=resize_aspect_ratios,
+            do_convert=do_convert,
+            image_convert_mode=image_convert_mode,
+            do_quantize=do_quantize,
+            quantize_color_count=quantize_color_count,
+            return_mode=return_mode,
+            render_grayscale=render_grayscale,
+        )
+
+        return dict(enumerate(rastered, start=1))
+
+    def _validate_page_numbers(self, page_numbers: Iterable[int]) -> List[int]:
+        """
+        Checks that every one-indexed page number is in the document, and returns them as a list
         """
-        result = {}
+        page_numbers = list(page_numbers)
+
+        for page_number in page_numbers:
+            if page_number <= 0 or page_number > self.num_pages:
+                raise ValueError(f"Page number must be between 1 and {self.num_pages}")
+
+        return page_numbers
+
+    def rasterize_pdf_pages(
+        self,
+        page_numbers: Optional[Iterable[int]],
+        *,
+        dpi: int = DEFAULT_DPI,
+        downscale_size: Optional[Tuple[int, int]] = None,
+        resize_mode: ResizeModes = "thumbnail",
+        max_file_size_bytes: Optional[int] = None,
+        resize_aspect_ratios: Optional[Iterable[AspectRatioRule]] = None,
+        do_convert: bool = False,
+        image_convert_mode: str = "L",
+        do_quantize: bool = False,
+        quantize_color_count: int = 8,
+        return_mode: Literal["pil", "bytes"] = "bytes",
+        render_grayscale: bool = False,
+    ) -> List[Union[bytes, Image.Image]]:
+        """
+        Rasterizes a subset of the document's pages using Pdfium
+
+        The result is in the same order as `page_numbers`. If `page_numbers` is None, every page is rasterized.
+        """
+        if page_numbers is not None:
+            page_numbers = self._validate_page_numbers(page_numbers)
 
         post_process_fn = None
 
@@ -290,18 +344,14 @@ class PdfDocument(BaseModel):
                 max_file_size_bytes=max_file_size_bytes,
             )
 
-        for idx, rastered in enumerate(
-            rasterize_pdf_with_pdfium(
-                self.file_bytes,
-                scale=(1 / 72) * dpi,
-                grayscale=render_grayscale,
-                return_mode=return_mode,
-                post_process_fn=post_process_fn,
-            )
-        ):
-            result[idx + 1] = rastered
-
-        return result
+        return rasterize_pdf_with_pdfium(
+            self.file_bytes,
+            scale=(1 / 72) * dpi,
+            grayscale=render_grayscale,
+            return_mode=return_mode,
+            post_process_fn=post_process_fn,
+            page_numbers=page_numbers,
+        )
 
     def split(self, start: Optional[int] = None, stop: Optional[int] = None):
         """
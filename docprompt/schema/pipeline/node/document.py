@@ -3,8 +3,10 @@ from typing import (
     TYPE_CHECKING,
     ForwardRef,
     Generic,
+    Iterable,
     List,
     Optional,
+    Tuple,
     Type,
     Union,
 )
@@ -201,26 +203,75 @@ class DocumentNode(BaseNode, Generic[DocumentNodeMetadata, PageNodeMetadata]):
 
         fs_manager = FileSystemManager(path, **kwargs)
 
-        pdf_bytes, metadata_bytes, page_metadata_bytes = fs_manager.read(
-            file_hash, **kwargs
-        )
+        sidecars = fs_manager.read(file_hash, **kwargs)
+
+        return cls._from_sidecars(path, fs_manager.get_pdf_name(file_hash), *sidecars)
+
+    @classmethod
+    async def afrom_storage(cls, path: str, file_hash: str, **kwargs) -> Self:
+        """Load the document node from storage without blocking the event loop.
+
+        See `from_storage` for the arguments.
+        """
+
+        fs_manager = FileSystemManager(path, **kwargs)
 
-        doc = PdfDocument.from_bytes(pdf_bytes, name=fs_manager.get_pdf_name(file_hash))
+        sidecars = await fs_manager.aread(file_hash, **kwargs)
+
+        return cls._from_sidecars(path, fs_manager.get_pdf_name(file_hash), *sidecars)
+
+    @classmethod
+    def from_storage_many(
+        cls, path: str, file_hashes: Iterable[str], **kwargs
+    ) -> List[Self]:
+        """Load many document nodes from storage, fetching all of their sidecars at once.
+
+        Args:
+            path (str): The base path to storage location.
+            file_hashes (Iterable[str]): The hashes of the documents.
+            **kwargs: Additional keyword arguments for fsspec FileSystem
+
+        Returns:
+            List[DocumentNode]: The loaded document nodes, in the order of `file_hashes`.
+        """
+
+        file_hashes = list(file_hashes)
+
+        fs_manager = FileSystemManager(path, **kwargs)
+
+        all_sidecars = fs_manager.read_many(file_hashes, **kwargs)
+
+        return [
+            cls._from_sidecars(path, fs_manager.get_pdf_name(file_hash), *sidecars)
+            for file_hash, sidecars in zip(file_hashes, all_sidecars)
+        ]
+
+    @classmethod
+    def _from_sidecars(
+        cls,
+        path: str,
+        pdf_name: str,
+        pdf_bytes: bytes,
+        metadata_bytes: Optional[bytes],
+        page_metadata_bytes: Optional[bytes],
+    ) -> Self:
+        doc = PdfDocument.from_bytes(pdf_bytes, name=pdf_name)
         node = cls.from_document(doc)
 
         if metadata_bytes:
-            metadata_json = json.loads(metadata_bytes.decode("utf-8"))
-            metadata = cls.metadata_class().from_owner(node, **metadata_json)
+            metadata = cls.metadata_class().model_validate_json(metadata_bytes)
+            metadata.owner = node
         else:
             metadata = cls.metadata_class().from_owner(node, **{})
 
         if page_metadata_bytes:
-            page_metadata_json = [
-                json.loads(page_str)
-                for page_str in json.loads(page_metadata_bytes.decode("utf-8"))
-            ]
+            # Each page's metadata is stored as a JSON string, which pydantic-core parses
+            # instead of `json.loads`. The before-validator on `BaseMetadata` still receives
+            # (and rebuilds) a dict of the parsed fields
+            page_metadata_class = cls.page_metadata_class()
             page_metadata = [
-                cls.page_metadata_class()(**page) for page in page_metadata_json
+                page_metadata_class.model_validate_json(page_str)
+                for page_str in json.loads(page_metadata_bytes)
             ]
         else:
             page_metadata = [cls.page_metadata_class()(**{}) for _ in range(len(doc))]
@@ -228,7 +279,7 @@ class DocumentNode(BaseNode, Generic[DocumentNodeMetadata, PageNodeMetadata]):
         # Store the metadata on the node and page nodes
         node.metadata = metadata
         for page, meta in zip(node.page_nodes, page_metadata):
-            meta.set_owner(page)
+            meta.owner = page
             page.metadata = meta
 
         # Make sure to set the persistance path on the node
@@ -258,13 +309,57 @@ class DocumentNode(BaseNode, Generic[DocumentNodeMetadata, PageNodeMetadata]):
 
         fs_manager = FileSystemManager(path, **kwargs)
 
+        return fs_manager.write(*self._to_sidecars(), **kwargs)
+
+    async def apersist(
+        self, path: Optional[str] = None, **kwargs
+    ) -> FileSidecarsPathManager:
+        """Persist a document node to storage without blocking the event loop.
+
+        See `persist` for the arguments.
+        """
+
+        path = path or self.persistance_path
+
+        if path is None:
+            raise ValueError("The path must be provided to persist the document node.")
+
+        # Make sure to update the persistance path
+        self.persistance_path = path
+
+        fs_manager = FileSystemManager(path, **kwargs)
+
+        return await fs_manager.awrite(*self._to_sidecars(), **kwargs)
+
+    @classmethod
+    def persist_many(
+        cls, nodes: Iterable["DocumentNode"], path: str, **kwargs
+    ) -> List[FileSidecarsPathManager]:
+        """Persist many document nodes to storage, writing all of their sidecars at once.
+
+        Args:
+            nodes (Iterable[DocumentNode]): The document nodes to persist.
+            path (str): The base path to storage location, set as each node's `persistance_path`.
+            **kwargs: Additional keyword arguments for fsspec FileSystem
+
+        Returns:
+            List[FileSidecarsPathManager]: The file path managers, in the order of `nodes`.
+        """
+
+        nodes = list(nodes)
+
+        for node in nodes:
+            node.persistance_path = path
+
+        fs_manager = FileSystemManager(path, **kwargs)
+
+        return fs_manager.write_many([node._to_sidecars() for node in nodes], **kwargs)
+
+    def _to_sidecars(self) -> Tuple[bytes, bytes, bytes]:
         pdf_bytes = self.document.get_bytes()
-        metadata_bytes = bytes(self.metadata.model_dump_json(), encoding="utf-8")
-        page_metadata_bytes = bytes(
-            json.dumps([page.metadata.model_dump_json() for page in self.page_nodes]),
-            encoding="utf-8",
-        )
+        metadata_bytes = self.metadata.model_dump_json().encode("utf-8")
+        page_metadata_bytes = json.dumps(
+            [page.metadata.model_dump_json() for page in self.page_nodes]
+        ).encode("utf-8")
 
-        return fs_manager.write(
-            pdf_bytes, metadata_bytes, page_metadata_bytes, **kwargs
-        )
+        return pdf_bytes, metadata_bytes, page_metadata_bytes
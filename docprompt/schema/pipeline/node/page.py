@@ -46,17 +46,19 @@ class PageNode(BaseNode, Generic[PageNodeMetadata]):
     )
 
     _raster_cache: Dict[str, bytes] = PrivateAttr(default_factory=dict)
+    _raster_params: Dict[str, str] = PrivateAttr(default_factory=dict)
 
     def __getstate__(self):
         state = super().__getstate__()
 
         state["__pydantic_private__"]["_raster_cache"] = {}
+        state["__pydantic_private__"]["_raster_params"] = {}
 
         return state
 
     @property
     def rasterizer(self):
-        return PageRasterizer(self._raster_cache, self)
+        return PageRasterizer(self._raster_cache, self, self._raster_params)
 
     def search(
         self, query: str, refine_to_words: bool = True, require_exact_match: bool = True
@@ -1,34 +1,62 @@
 import base64
-from typing import TYPE_CHECKING, Dict, Iterable, List, Literal, Optional, Tuple, Union
+import io
+from typing import (
+    TYPE_CHECKING,
+    Dict,
+    Iterable,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+    Union,
+)
 
 from PIL import Image
 
-from docprompt.rasterize import AspectRatioRule, ResizeModes, process_raster_image
+from docprompt.rasterize import (
+    AspectRatioRule,
+    ResizeModes,
+    process_raster_image,
+    save_image_to_bytes,
+)
 
 if TYPE_CHECKING:
     from docprompt.schema.pipeline.node import PageNode
     from docprompt.schema.pipeline.node.document import DocumentNode
 
 
+PageRasters = List[Optional[Union[bytes, Image.Image]]]
+
+
 class PageRasterizer:
-    def __init__(self, raster_cache: Dict[str, bytes], owner: "PageNode"):
+    def __init__(
+        self,
+        raster_cache: Dict[str, bytes],
+        owner: "PageNode",
+        raster_params: Optional[Dict[str, str]] = None,
+    ):
         self.raster_cache = raster_cache
         self.owner = owner
+        # The render parameters each cached raster was produced with, by cache key
+        self.raster_params = raster_params if raster_params is not None else {}
 
-    def _construct_cache_key(self, **kwargs):
-        key = ""
+    @staticmethod
+    def _construct_cache_key(**kwargs):
+        parts = []
 
         for k, v in kwargs.items():
-            if isinstance(v, Iterable) and not isinstance(v, str):
-                v = ",".join(str(i) for i in v)
+            if isinstance(v, str):
+                pass
+            elif isinstance(v, Iterable):
+                v = ",".join(map(str, v))
             elif isinstance(v, bool):
-                v = str(v).lower()
+                v = "true" if v else "false"
             else:
                 v = str(v)
 
-            key += f"{k}={v},"
+            parts.append(k + "=" + v + ",")
 
-        return key
+        return "".join(parts)
 
     def rasterize(
         self,
@@ -45,21 +73,18 @@ class PageRasterizer:
         quantize_color_count: int = 8,
         max_file_size_bytes: Optional[int] = None,
     ) -> Union[bytes, Image.Image]:
-        cache_key = (
-            name
-            if name
-            else self._construct_cache_key(
-                dpi=dpi,
-                downscale_size=downscale_size,
-                resize_mode=resize_mode,
-                resize_aspect_ratios=resize_aspect_ratios,
-                do_convert=do_convert,
-                image_convert_mode=image_convert_mode,
-                do_quantize=do_quantize,
-                quantize_color_count=quantize_color_count,
-                max_file_size_bytes=max_file_size_bytes,
-            )
+        params_key = self._construct_cache_key(
+            dpi=dpi,
+            downscale_size=downscale_size,
+            resize_mode=resize_mode,
+            resize_aspect_ratios=resize_aspect_ratios,
+            do_convert=do_convert,
+            image_convert_mode=image_convert_mode,
+            do_quantize=do_quantize,
+            quantize_color_count=quantize_color_count,
+            max_file_size_bytes=max_file_size_bytes,
         )
+        cache_key = name if name else params_key
 
         if cache_key in self.raster_cache:
             rastered = self.raster_cache[cache_key]
@@ -78,12 +103,10 @@ class PageRasterizer:
             )
 
             self.raster_cache[cache_key] = rastered
+            self.raster_params[cache_key] = params_key
 
         if return_mode == "pil" and isinstance(rastered, bytes):
-            import io
-
-            from PIL import Image
-
+            # Decoded per call, so no caller can mutate an image another caller holds
             return Image.open(io.BytesIO(rastered))
         elif return_mode == "bytes" and isinstance(rastered, bytes):
             return rastered
@@ -122,9 +145,12 @@ class PageRasterizer:
 
     def clear_cache(self):
         self.raster_cache.clear()
+        self.raster_params.clear()
 
     def pop(self, name: str, default=None):
-        return self.raster_cache.pop(name, default=default)
+        self.raster_params.pop(name, None)
+
+        return self.raster_cache.pop(name, default)
 
 
 def process_bytes(
@@ -175,8 +201,100 @@ class DocumentRasterizer:
         quantize_color_count: int = 8,
         max_file_size_bytes: Optional[int] = None,
         render_grayscale: bool = False,
+        page_numbers: Optional[Iterable[int]] = None,
     ) -> List[Union[bytes, Image.Image]]:
-        images = self.owner.document.rasterize_pdf(
+        """
+        Rasterizes every page of the document under `name`, or only `page_numbers` if given
+
+        Pages that already hold a raster under `name`, rendered with the same parameters, are reused,
+        and only the other pages are rendered. The result is in the same order as `page_numbers`.
+        """
+        if page_numbers is None:
+            page_nodes = self.owner.page_nodes
+        else:
+            page_numbers = self.owner.document._validate_page_numbers(page_numbers)
+
+            page_nodes = [
+                self.owner.page_nodes[page_number - 1] for page_number in page_numbers
+            ]
+
+        params_key = PageRasterizer._construct_cache_key(
+            dpi=dpi,
+            downscale_size=downscale_size,
+            resize_mode=resize_mode,
+            resize_aspect_ratios=resize_aspect_ratios,
+            do_convert=do_convert,
+            image_convert_mode=image_convert_mode,
+            do_quantize=do_quantize,
+            quantize_color_count=quantize_color_count,
+            max_file_size_bytes=max_file_size_bytes,
+        )
+
+        # Page rasterizers cannot render in grayscale, so the flag only appears in the key when set
+        if render_grayscale:
+            params_key += "render_grayscale=true,"
+
+        missing = [
+            page_node.page_number
+            for page_node in page_nodes
+            if name not in page_node._raster_cache
+            or page_node._raster_params.get(name) != params_key
+        ]
+
+        if missing:
+            self._rasterize_missing(
+                name,
+                missing,
+                params_key,
+                dpi=dpi,
+                downscale_size=downscale_size,
+                resize_mode=resize_mode,
+                resize_aspect_ratios=resize_aspect_ratios,
+                do_convert=do_convert,
+                image_convert_mode=image_convert_mode,
+                do_quantize=do_quantize,
+                quantize_color_count=quantize_color_count,
+                max_file_size_bytes=max_file_size_bytes,
+                render_grayscale=render_grayscale,
+            )
+
+        images = []
+
+        for page_node in page_nodes:
+            image = page_node._raster_cache[name]
+
+            # Rendered rasters are cached as bytes and decoded per call, so no caller can mutate
+            # an image another caller holds. Propagated rasters may be cached as images instead
+            if return_mode == "pil" and isinstance(image, bytes):
+                image = Image.open(io.BytesIO(image))
+            elif return_mode == "pil":
+                image = image.copy()
+            elif return_mode == "bytes" and isinstance(image, Image.Image):
+                image = save_image_to_bytes(image)
+
+            images.append(image)
+
+        return images
+
+    def _rasterize_missing(
+        self,
+        name: str,
+        page_numbers: List[int],
+        params_key: str,
+        *,
+        dpi: int,
+        downscale_size: Optional[Tuple[int, int]],
+        resize_mode: ResizeModes,
+        resize_aspect_ratios: Optional[Iterable[AspectRatioRule]],
+        do_convert: bool,
+        image_convert_mode: str,
+        do_quantize: bool,
+        quantize_color_count: int,
+        max_file_size_bytes: Optional[int],
+        render_grayscale: bool,
+    ):
+        images = self.owner.document.rasterize_pdf_pages(
+            page_numbers,
             dpi=dpi,
             downscale_size=downscale_size,
             resize_mode=resize_mode,
@@ -187,21 +305,35 @@ class DocumentRasterizer:
             quantize_color_count=quantize_color_count,
             max_file_size_bytes=max_file_size_bytes,
             render_grayscale=render_grayscale,
-            return_mode=return_mode,
+            return_mode="bytes",
         )
 
-        for page_number, image in images.items():
+        for page_number, image in zip(page_numbers, images):
             page_node = self.owner.page_nodes[page_number - 1]
 
             page_node._raster_cache[name] = image
+            page_node._raster_params[name] = params_key
 
-        return list(images.values())
-
-    def propagate_cache(self, name: str, rasters: Dict[int, Union[bytes, Image.Image]]):
+    def propagate_cache(
+        self,
+        name: str,
+        rasters: Union[PageRasters, Dict[int, Union[bytes, Image.Image]]],
+    ):
         """
-        Should be one-indexed
+        Accepts either a list indexed by `page_number - 1`, with `None` for gaps, or a one-indexed dict
         """
-        for page_number, raster in rasters.items():
+        if isinstance(rasters, dict):
+            items = rasters.items()
+        else:
+            items = (
+                (idx + 1, raster)
+                for idx, raster in enumerate(rasters)
+                if raster is not None
+            )
+
+        for page_number, raster in items:
             page_node = self.owner.page_nodes[page_number - 1]
 
             page_node._raster_cache[name] = raster
+            # The parameters of a propagated raster are unknown, so it is never reused by `rasterize`
+            page_node._raster_params.pop(name, None)
@@ -7,13 +7,32 @@ selection of file system.
 """
 
 import os
+import uuid
 import warnings
-from typing import Any, Dict, Optional, Tuple, Union
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Union
 
 import fsspec
-from pydantic import BaseModel, Field, computed_field, model_validator
+from fsspec.implementations.local import LocalFileSystem
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    PrivateAttr,
+    computed_field,
+    model_validator,
+)
 from pydantic_core import core_schema
 
+from docprompt.utils.async_utils import to_thread
+
+_PDF_FILE_NAME = "base.pdf"
+_METADATA_FILE_NAME = "base.json"
+_PAGE_METADATA_FILE_NAME = "pages.json"
+
+_MAX_BATCH_BYTES = 128 * 1024 * 1024
+
 
 class FileSidecarsPathManager(BaseModel):
     """The FileSidecarsPathManager provides a wrapper around fsspec to provide a clean interface for
@@ -27,26 +46,29 @@ class FileSidecarsPathManager(BaseModel):
         page_metadata (str): The path for the page metadata file.
     """
 
+    # The paths are derived from these two fields and cached, so the model is frozen
+    model_config = ConfigDict(frozen=True)
+
     base_path: str = Field(...)
     file_hash: str = Field(...)
 
     @computed_field
-    @property
+    @cached_property
     def pdf(self) -> str:
         """The path for the PDF file."""
-        return f"{self.base_path}/{self.file_hash}/base.pdf"
+        return f"{self.base_path}/{self.file_hash}/{_PDF_FILE_NAME}"
 
     @computed_field
-    @property
+    @cached_property
     def metadata(self) -> str:
         """The path for the metadata file."""
-        return f"{self.base_path}/{self.file_hash}/base.json"
+        return f"{self.base_path}/{self.file_hash}/{_METADATA_FILE_NAME}"
 
     @computed_field
-    @property
+    @cached_property
     def page_metadata(self) -> str:
         """The path for the page metadata file."""
-        return f"{self.base_path}/{self.file_hash}/pages.json"
+        return f"{self.base_path}/{self.file_hash}/{_PAGE_METADATA_FILE_NAME}"
 
 
 class FileSystemAnnotation:
@@ -88,6 +110,10 @@ class FileSystemManager(BaseModel):
     fs: FileSystemAnnotation = Field(...)
     fs_kwargs: Dict[str, Any] = Field(...)
 
+    # Directories known to exist, so that repeated writes into the same sidecar directory
+    # skip the `exists` / `mkdirs` round-trips on remote backends (never used locally)
+    _known_dirs: Set[str] = PrivateAttr(default_factory=set)
+
     def __init__(self, url: str, **kwargs: Any) -> None:
         """Initialize the FileSystemManager with the path and file system backend."""
         super().__init__(path=url, fs_kwargs=kwargs)
@@ -100,7 +126,8 @@ class FileSystemManager(BaseModel):
         path = data.get("path", None)
         fs_kwargs = data.get("fs_kwargs", {})
 
-        # Validate that the path is a valid filesystem path
+        # Validate that the path is a valid filesystem path. fsspec caches the instance itself,
+        # per process (and per thread, for sync backends)
         file_system = fsspec.url_to_fs(path, **fs_kwargs)
 
         # Set the data values on the model
@@ -110,45 +137,123 @@ class FileSystemManager(BaseModel):
 
         return data
 
-    def get_pdf_name(self, file_hash: str) -> FileSidecarsPathManager:
-        """Get the file manager for a specific file hash."""
-        path_manager = FileSidecarsPathManager(base_path=self.path, file_hash=file_hash)
-        return os.path.basename(path_manager.pdf)
+    def get_pdf_name(self, file_hash: str) -> str:
+        """Get the name of the PDF file for a specific file hash.
+
+        The sidecar file names are the same for every hash, so no path manager is needed.
+        """
+        return _PDF_FILE_NAME
 
-    def _write(self, value: bytes, *args, **kwargs) -> None:
-        """Write a value to the file system.
+    def _sidecar_paths(self, file_hash: str) -> Tuple[str, str, str]:
+        """Get the PDF, metadata and page metadata paths for a file hash.
 
-        Args:
-            value: The value to write.
-            *args: `fsspec.open` positional arguments.
-            **kwargs: `fsspec.open` keyword arguments.
+        This matches the paths of `FileSidecarsPathManager`, without validating a model
+        when only the paths are needed.
+        """
+        base = f"{self.path}/{file_hash}"
+
+        return (
+            f"{base}/{_PDF_FILE_NAME}",
+            f"{base}/{_METADATA_FILE_NAME}",
+            f"{base}/{_PAGE_METADATA_FILE_NAME}",
+        )
+
+    def _sidecar_values(
+        self,
+        file_hash: str,
+        pdf_bytes: bytes,
+        metadata_bytes: Optional[bytes],
+        page_metadata_bytes: Optional[bytes],
+    ) -> Tuple[Dict[str, bytes], List[str]]:
+        """Get the sidecar values to write for a file hash, and the stale sidecar paths to clear.
+
+        The sidecars are written in one batch, and any sidecar that is not provided is
+        cleared, so that the node is read without it (overwriting any existing metadata).
         """
-        # Make sure the path exists
-        parent_dir = os.path.dirname(args[0])
+        pdf_path, metadata_path, page_metadata_path = self._sidecar_paths(file_hash)
 
+        values = {pdf_path: pdf_bytes}
+        stale_paths = []
+
+        if metadata_bytes is not None:
+            values[metadata_path] = metadata_bytes
+        else:
+            stale_paths.append(metadata_path)
+
+        if page_metadata_bytes is not None:
+            values[page_metadata_path] = page_metadata_bytes
+        else:
+            stale_paths.append(page_metadata_path)
+
+        return values, stale_paths
+
+    def _write_many(self, values: Dict[str, bytes], **kwargs) -> None:
+        """Write several values to the file system in a single `pipe` call.
+
+        Async backends (S3, GCS, etc.) upload the values concurrently, rather than
+        one round-trip per file. Object stores only expose an object once its upload
+        completes, but a local file is visible while it is written, so on the local file
+        system each value is written to a temporary file and moved into place instead.
+
+        Args:
+            values: A mapping of path to the bytes to write there.
+            **kwargs: `fs.pipe` keyword arguments.
+        """
         kwargs = {**self.fs_kwargs, **kwargs}
 
-        if not self.fs.exists(parent_dir, **kwargs):
-            self.fs.mkdirs(parent_dir, **kwargs)
+        for parent_dir in {os.path.dirname(path) for path in values}:
+            self._ensure_dir(parent_dir)
 
-        with self.fs.open(*args, **kwargs) as f:
-            f.write(value)
+        if isinstance(self.fs, LocalFileSystem):
+            for path, value in values.items():
+                _replace_local_file(path, value)
+        else:
+            self.fs.pipe(values, **kwargs)
+
+    def _ensure_dir(self, parent_dir: str) -> None:
+        """Create a directory if it does not exist, skipping directories already known to exist.
 
-    def _read(self, *args, **kwargs) -> bytes:
-        """A wrapper for reading with fsspec.
+        `makedirs` with `exist_ok` is a single idempotent call, so there is no separate
+        `exists` probe beforehand. On the local file system that call is cheap, and a
+        directory may be removed outside the manager, so it is never skipped there.
 
         Args:
-            *args: `fsspec.open` positional arguments.
-            **kwargs: `fsspec.open` keyword arguments.
+            parent_dir (str): The directory to create.
+        """
+        if isinstance(self.fs, LocalFileSystem):
+            self.fs.makedirs(parent_dir, exist_ok=True)
+            return
+
+        if parent_dir in self._known_dirs:
+            return
+
+        self.fs.makedirs(parent_dir, exist_ok=True)
+
+        self._known_dirs.add(parent_dir)
+
+    def _read_many(
+        self, paths: List[str], **kwargs
+    ) -> Dict[str, Union[bytes, Exception]]:
+        """Read several values from the file system in a single `cat` call.
+
+        Async backends fetch the values concurrently, rather than one round-trip per file.
+        `cat` keys its results by normalized path, so the paths must already be normalized,
+        as the sidecar paths built from `self.path` are.
+
+        Args:
+            paths: The paths to read.
+            **kwargs: `fs.cat` keyword arguments.
 
         Returns:
-            bytes: The read value.
+            Dict[str, Union[bytes, Exception]]: A mapping of each path to its bytes, or to
+                the exception raised while reading it.
         """
 
         kwargs = {**self.fs_kwargs, **kwargs}
 
-        with self.fs.open(*args, **kwargs) as f:
-            return f.read()
+        results = self.fs.cat(paths, on_error="return", **kwargs)
+
+        return {path: results[path] for path in paths}
 
     def _delete(self, path: str, **kwargs):
         """Delete a file from the file system.
@@ -160,8 +265,31 @@ class FileSystemManager(BaseModel):
 
         kwargs = {**self.fs_kwargs, **kwargs}
 
-        if self.fs.exists(path, **kwargs):
+        # A missing file is the common case when clearing stale sidecars, so rather than a
+        # separate `exists` probe per delete, a single `rm` is attempted
+        try:
             self.fs.rm(path, **kwargs)
+        except FileNotFoundError:
+            pass
+
+    def _delete_many(self, paths: List[str], **kwargs) -> None:
+        """Delete several files from the file system in a single `rm` call.
+
+        Async backends delete the files in one round-trip. Some backends stop at the first
+        missing file, in which case each file is deleted on its own instead.
+
+        Args:
+            paths: The paths to the files to delete.
+            **kwargs: Additional keyword arguments to pass to the file system.
+        """
+        if not paths:
+            return
+
+        try:
+            self.fs.rm(paths, **{**self.fs_kwargs, **kwargs})
+        except FileNotFoundError:
+            for path in paths:
+                self._delete(path, **kwargs)
 
     def write(
         self,
@@ -177,9 +305,6 @@ class FileSystemManager(BaseModel):
 
         file_hash = hash_from_bytes(pdf_bytes)
 
-        # Craete the sidecar manager
-        path_manager = FileSidecarsPathManager(base_path=self.path, file_hash=file_hash)
-
         if encrypt:
             warnings.warn("Encryption is not yet supported for the FileSystemManager.")
 
@@ -188,48 +313,184 @@ class FileSystemManager(BaseModel):
 
         kwargs = {**self.fs_kwargs, **kwargs}
 
-        # Write the file
-        self._write(pdf_bytes, path_manager.pdf, "wb", **kwargs)
+        values, stale_paths = self._sidecar_values(
+            file_hash, pdf_bytes, metadata_bytes, page_metadata_bytes
+        )
 
-        # If the metadata is provided, we want to write it
-        if metadata_bytes is not None:
-            self._write(metadata_bytes, path_manager.metadata, "wb", **kwargs)
+        self._write_many(values, **kwargs)
 
-        # Otherwise, we need to clear the metadata file, so that the node is read
-        # without any metadata (overwriting any existing metadata)
-        else:
-            # Check if a metadata file exists
-            self._delete(path_manager.metadata, **kwargs)
+        self._delete_many(stale_paths, **kwargs)
 
-        if page_metadata_bytes is not None:
-            self._write(page_metadata_bytes, path_manager.page_metadata, "wb", **kwargs)
+        # The path manager is only built for the caller
+        return FileSidecarsPathManager(base_path=self.path, file_hash=file_hash)
 
-        # Otherwise, we need to clear the page metadata file, so that the node is read
-        # without any metadata (overwriting any existing metadata)
-        else:
-            self._delete(path_manager.page_metadata, **kwargs)
+    async def awrite(
+        self,
+        pdf_bytes: bytes,
+        metadata_bytes: Optional[bytes] = None,
+        page_metadata_bytes: Optional[bytes] = None,
+        encrypt: bool = False,
+        compress: bool = False,
+        **kwargs,
+    ) -> FileSidecarsPathManager:
+        """Write a sidecar to the filesystem without blocking the event loop.
 
-        return path_manager
+        The write runs in a worker thread, where async fsspec backends upload the
+        sidecars concurrently, so many documents can be persisted at once.
+        """
+        return await to_thread(
+            self.write,
+            pdf_bytes,
+            metadata_bytes,
+            page_metadata_bytes,
+            encrypt=encrypt,
+            compress=compress,
+            **kwargs,
+        )
 
     def read(
         self, file_hash: str, **kwargs
     ) -> Tuple[bytes, Union[bytes, None], Union[bytes, None]]:
         """Read a pair of sidecar files from the filesystem."""
 
-        # Craete the sidecar manager
-        path_manager = FileSidecarsPathManager(base_path=self.path, file_hash=file_hash)
+        paths = self._sidecar_paths(file_hash)
 
-        # Read the PDF file
-        pdf_bytes = self._read(path_manager.pdf, "rb", **kwargs)
+        results = self._read_many(list(paths), **kwargs)
 
-        try:
-            metadata_bytes = self._read(path_manager.metadata, "rb", **kwargs)
-        except FileNotFoundError:
-            metadata_bytes = None
+        return _sidecars_from_results(results, paths)
 
-        try:
-            page_metadata_bytes = self._read(path_manager.page_metadata, "rb", **kwargs)
-        except FileNotFoundError:
-            page_metadata_bytes = None
+    async def aread(
+        self, file_hash: str, **kwargs
+    ) -> Tuple[bytes, Union[bytes, None], Union[bytes, None]]:
+        """Read a pair of sidecar files from the filesystem without blocking the event loop."""
+        return await to_thread(self.read, file_hash, **kwargs)
+
+    def write_many(
+        self,
+        items: Iterable[Tuple[bytes, Optional[bytes], Optional[bytes]]],
+        max_batch_bytes: int = _MAX_BATCH_BYTES,
+        **kwargs,
+    ) -> List[FileSidecarsPathManager]:
+        """Write the sidecars of many documents to the filesystem.
+
+        Args:
+            items: `(pdf_bytes, metadata_bytes, page_metadata_bytes)` for each document.
+            max_batch_bytes: The most bytes to hand to a single `pipe` call, so a large
+                ingest is not held in flight all at once.
+            **kwargs: Additional keyword arguments to pass to the file system.
+
+        Returns:
+            List[FileSidecarsPathManager]: The path managers, in the order of `items`.
+        """
+        from docprompt.utils.util import hash_from_bytes
+
+        items = list(items)
+
+        # Hashing releases the GIL, so large PDFs are hashed in parallel
+        with ThreadPoolExecutor() as executor:
+            file_hashes = list(
+                executor.map(hash_from_bytes, (item[0] for item in items))
+            )
+
+        kwargs = {**self.fs_kwargs, **kwargs}
+
+        batch: Dict[str, bytes] = {}
+        batch_bytes = 0
+        # Ordered like a set, so a sidecar cleared by one item and written by a later one
+        # is kept, as it would be when writing the items one at a time
+        stale_paths: Dict[str, None] = {}
+
+        for file_hash, (pdf_bytes, metadata_bytes, page_metadata_bytes) in zip(
+            file_hashes, items
+        ):
+            values, stale = self._sidecar_values(
+                file_hash, pdf_bytes, metadata_bytes, page_metadata_bytes
+            )
+            values_bytes = sum(len(value) for value in values.values())
+
+            if batch and batch_bytes + values_bytes > max_batch_bytes:
+                self._write_many(batch, **kwargs)
+                batch, batch_bytes = {}, 0
+
+            batch.update(values)
+            batch_bytes += values_bytes
+
+            for path in values:
+                stale_paths.pop(path, None)
+
+            stale_paths.update(dict.fromkeys(stale))
+
+        if batch:
+            self._write_many(batch, **kwargs)
+
+        self._delete_many(list(stale_paths), **kwargs)
+
+        return [
+            FileSidecarsPathManager(base_path=self.path, file_hash=file_hash)
+            for file_hash in file_hashes
+        ]
+
+    def read_many(
+        self, file_hashes: Iterable[str], **kwargs
+    ) -> List[Tuple[bytes, Union[bytes, None], Union[bytes, None]]]:
+        """Read the sidecars of many documents from the filesystem in a single `cat` call.
+
+        Args:
+            file_hashes: The hashes of the documents to read.
+            **kwargs: Additional keyword arguments to pass to the file system.
+
+        Returns:
+            List[Tuple[bytes, Union[bytes, None], Union[bytes, None]]]: The sidecars of each
+                document, in the order of `file_hashes`.
+        """
+        all_paths = [self._sidecar_paths(file_hash) for file_hash in file_hashes]
+
+        results = self._read_many(
+            [path for paths in all_paths for path in paths], **kwargs
+        )
+
+        return [_sidecars_from_results(results, paths) for paths in all_paths]
+
+
+def _replace_local_file(path: str, value: bytes) -> None:
+    """Write a local file atomically, so a reader never sees a partially written sidecar."""
+    # The temporary file sits next to the target, so the final move is a rename on the
+    # same device, and it is created like any other file, with the process umask applied
+    temp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+    fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(value)
+
+        os.replace(temp_path, path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+
+
+def _sidecars_from_results(
+    results: Dict[str, Union[bytes, Exception]], paths: Tuple[str, str, str]
+) -> Tuple[bytes, Union[bytes, None], Union[bytes, None]]:
+    pdf_path, metadata_path, page_metadata_path = paths
+
+    pdf_bytes = results[pdf_path]
+
+    if isinstance(pdf_bytes, Exception):
+        raise pdf_bytes
+
+    metadata_bytes = _optional_sidecar(results[metadata_path])
+    page_metadata_bytes = _optional_sidecar(results[page_metadata_path])
+
+    return pdf_bytes, metadata_bytes, page_metadata_bytes
+
+
+def _optional_sidecar(result: Union[bytes, Exception]) -> Union[bytes, None]:
+    """A missing metadata sidecar means the node was stored without it."""
+    if isinstance(result, FileNotFoundError):
+        return None
+
+    if isinstance(result, Exception):
+        raise result
 
-        return pdf_bytes, metadata_bytes, page_metadata_bytes
+    return result
@@ -18,7 +18,6 @@ from docprompt._decorators import flexible_methods
 
 from .capabilities import DocumentLevelCapabilities, PageLevelCapabilities
 from .result import BaseDocumentResult, BasePageResult
-from .util import _init_context_var, init_context
 
 if TYPE_CHECKING:
     from docprompt.schema.pipeline import DocumentNode
@@ -70,12 +69,12 @@ class AbstractTaskProvider(BaseModel, Generic[TTaskInput, TTaskConfig, TTaskResu
         abstract = True
 
     def __init__(self, invoke_kwargs: Dict[str, str] = None, **data):
-        with init_context({"invoke_kwargs": invoke_kwargs or {}}):
-            self.__pydantic_validator__.validate_python(
-                data,
-                self_instance=self,
-                context=_init_context_var.get(),
-            )
+        # The validation context carries the invoke kwargs straight to `set_invoke_kwargs`
+        self.__pydantic_validator__.validate_python(
+            data,
+            self_instance=self,
+            context={"invoke_kwargs": invoke_kwargs or {}},
+        )
 
     @model_validator(mode="before")
     @classmethod
@@ -99,8 +98,10 @@ class AbstractTaskProvider(BaseModel, Generic[TTaskInput, TTaskConfig, TTaskResu
     def set_invoke_kwargs(self, info: ValidationInfo) -> Self:
         """
         Set the default invoke kwargs for the task provider.
+
+        The defaults are copied, so later changes to the caller's dict don't reach the provider.
         """
-        self._default_invoke_kwargs = info.context["invoke_kwargs"]
+        self._default_invoke_kwargs = dict(info.context["invoke_kwargs"])
         return self
 
     async def _ainvoke(
@@ -117,10 +118,12 @@ class AbstractTaskProvider(BaseModel, Generic[TTaskInput, TTaskConfig, TTaskResu
         config: Optional[TTaskConfig] = None,
         **kwargs,
     ) -> List[TTaskResult]:
-        invoke_kwargs = {
-            **self._default_invoke_kwargs,
-            **kwargs,
-        }
+        # Only build a merged dict when both sides have entries; unpacking into the call
+        # below copies whichever one is passed through as-is
+        if kwargs and self._default_invoke_kwargs:
+            invoke_kwargs = {**self._default_invoke_kwargs, **kwargs}
+        else:
+            invoke_kwargs = kwargs or self._default_invoke_kwargs
 
         return await self._ainvoke(input, config, **invoke_kwargs)
 
@@ -138,10 +141,10 @@ class AbstractTaskProvider(BaseModel, Generic[TTaskInput, TTaskConfig, TTaskResu
         config: Optional[TTaskConfig] = None,
         **kwargs,
     ) -> List[TTaskResult]:
-        invoke_kwargs = {
-            **self._default_invoke_kwargs,
-            **kwargs,
-        }
+        if kwargs and self._default_invoke_kwargs:
+            invoke_kwargs = {**self._default_invoke_kwargs, **kwargs}
+        else:
+            invoke_kwargs = kwargs or self._default_invoke_kwargs
 
         return self._invoke(input, config, **invoke_kwargs)
 
@@ -5,7 +5,7 @@ from threading import Lock
 from typing import TYPE_CHECKING, ClassVar, Dict, List, Optional
 
 import tqdm
-from pydantic import Field, SecretStr, model_validator
+from pydantic import Field, PrivateAttr, SecretStr, model_validator
 from tenacity import retry, stop_after_attempt, wait_exponential
 from typing_extensions import Self
 
@@ -25,7 +25,7 @@ from docprompt.tasks.ocr.base import BaseOCRProvider, ImageBytes
 from .result import OcrPageResult
 
 if TYPE_CHECKING:
-    pass
+    import aioboto3
 
 logger = logging.getLogger(__name__)
 
@@ -107,7 +107,7 @@ def process_page(
         [block["Text"] for block in blocks if block["BlockType"] == "WORD"]
     )
 
-    return OcrPageResult(
+    return OcrPageResult.model_construct(
         provider_name=provider_name,
         document_name=document_name,
         file_hash=file_hash,
@@ -168,6 +168,8 @@ class AmazonTextractOCRProvider(BaseOCRProvider):
     exclude_bounding_poly: bool = Field(False)
     return_images: bool = Field(False)
 
+    _session: Optional["aioboto3.Session"] = PrivateAttr(default=None)
+
     @model_validator(mode="after")
     def validate_aws_credentials(self) -> Self:
         # Set the AWS credentials from the environment if not provided
@@ -211,6 +213,14 @@ class AmazonTextractOCRProvider(BaseOCRProvider):
             ) from e
 
     def _get_session(self):
+        # Sessions resolve credentials and load the service models when first used, so one
+        # is reused for every request rather than rebuilt per chunk
+        if self._session is None:
+            self._session = self._create_session()
+
+        return self._session
+
+    def _create_session(self):
         import aioboto3
 
         return aioboto3.Session(
@@ -224,16 +234,24 @@ class AmazonTextractOCRProvider(BaseOCRProvider):
             else None,
         )
 
-    @default_retry_decorator
-    async def process_byte_chunk(self, image_bytes: bytes):
-        session = self._get_session()
+    def _get_textract_client(self):
+        from aiobotocore.config import AioConfig
 
-        async with session.client("textract") as textract_client:
-            response = await textract_client.detect_document_text(
-                Document={"Bytes": image_bytes}
-            )
+        return self._get_session().client(
+            "textract", config=AioConfig(max_pool_connections=self.max_workers)
+        )
 
-        return response
+    @default_retry_decorator
+    async def process_byte_chunk(self, image_bytes: bytes, textract_client=None):
+        if textract_client is None:
+            async with self._get_textract_client() as textract_client:
+                return await textract_client.detect_document_text(
+                    Document={"Bytes": image_bytes}
+                )
+
+        return await textract_client.detect_document_text(
+            Document={"Bytes": image_bytes}
+        )
 
     async def _process_document_concurrent(
         self,
@@ -241,18 +259,33 @@ class AmazonTextractOCRProvider(BaseOCRProvider):
         document_name: Optional[str] = None,
         document_hash: Optional[str] = None,
     ):
-        tasks = [
-            self.process_byte_chunk(image_bytes) for image_bytes in document_images
-        ]
+        semaphore = asyncio.Semaphore(self.max_workers)
+
+        # A single client, and its connection pool, is shared by every chunk of the document
+        async with self._get_textract_client() as textract_client:
+            with tqdm.tqdm(
+                total=len(document_images), desc="Processing document"
+            ) as pbar:
+
+                async def process_with_limit(image_bytes: ImageBytes) -> Dict:
+                    async with semaphore:
+                        result = await self.process_byte_chunk(
+                            image_bytes, textract_client=textract_client
+                        )
+
+                    pbar.update(1)
+
+                    return result
 
-        documents = []
-        for task in tqdm.tqdm(
-            asyncio.as_completed(tasks), total=len(tasks), desc="Processing document"
-        ):
-            result = await task
-            documents.append(result)
+                # Results are gathered in submission order, so each one lines up with its page
+                documents = await asyncio.gather(
+                    *(
+                        process_with_limit(image_bytes)
+                        for image_bytes in document_images
+                    )
+                )
 
-        logger.info("Recombining OCR results...")
+        logger.debug("Recombining OCR results...")
         return textract_documents_to_result(
             documents,
             self.name,
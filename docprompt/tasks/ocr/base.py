@@ -18,7 +18,8 @@ class BaseOCRProvider(
     def _populate_ocr_results(
         self, document_node: "DocumentNode", results: Dict[int, OcrPageResult]
     ) -> None:
+        page_nodes = document_node.page_nodes
+        name = self.name
+
         for page_number, result in results.items():
-            document_node.page_nodes[page_number - 1].ocr_results.results[self.name] = (
-                result
-            )
+            page_nodes[page_number - 1].ocr_results.results[name] = result
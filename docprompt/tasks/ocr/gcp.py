@@ -1,9 +1,23 @@
+import asyncio
 import logging
 import multiprocessing
-from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from enum import Enum
-from threading import Lock
-from typing import TYPE_CHECKING, ClassVar, Dict, List, Literal, Optional, Union
+from functools import cached_property
+from threading import BoundedSemaphore, Lock
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    ClassVar,
+    Dict,
+    Iterable,
+    List,
+    Literal,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 import tqdm
 from pydantic import BaseModel, Field, PrivateAttr
@@ -14,14 +28,13 @@ from docprompt.schema.layout import (
     BoundingPoly,
     DirectionChoices,
     NormBBox,
-    Point,
     SegmentLevels,
     TextBlock,
-    TextBlockMetadata,
     TextSpan,
 )
 from docprompt.tasks.capabilities import PageLevelCapabilities
 from docprompt.tasks.ocr.base import BaseOCRProvider
+from docprompt.utils.async_utils import to_thread
 from docprompt.utils.splitter import pdf_split_iter_with_max_bytes
 
 from .result import OcrPageResult
@@ -60,7 +73,16 @@ orientation_mapping: Dict[int, DirectionChoices] = {
     4: "LEFT",
 }
 
-service_account_file_read_lock = Lock()
+# Indexed by the orientation enum value, with unspecified (0) treated as upright
+_orientation_directions: Tuple[DirectionChoices, ...] = (
+    "UP",
+    "UP",
+    "RIGHT",
+    "DOWN",
+    "LEFT",
+)
+
+documentai_client_init_lock = Lock()
 
 # This will wait up to ~8 minutes before giving up, which covers almost all high-contention cases
 # TODO: Scope this to only retry on 429 and 5xx
@@ -97,48 +119,83 @@ class GCPPageMetadata(BaseModel):
     defect_scores: Dict[GCPDefectTypes, float] = Field(default_factory=dict)
 
 
+# The private helpers below build plain dicts, so that a whole text block, with its box,
+# poly, metadata and spans, is constructed by pydantic-core in a single validation call
+# rather than model by model from Python.
+
+
+def _bounding_poly_data(xs: List[float], ys: List[float]) -> Dict[str, Any]:
+    return {"normalized_vertices": [{"x": x, "y": y} for x, y in zip(xs, ys)]}
+
+
+def _bounding_box_data(xs: List[float], ys: List[float]) -> Dict[str, float]:
+    return {"x0": min(xs), "top": min(ys), "x1": max(xs), "bottom": max(ys)}
+
+
+def _coords_from_layout(
+    layout: Union["documentai.Document.Page.Layout", "documentai.Document.Page.Token"],
+) -> Tuple[List[float], List[float]]:
+    """
+    Reads the normalized vertices out of the protobuf once, as flat lists of x and y values
+    rounded to 5 places.
+
+    Rounding is monotonic, so the min and max of the rounded values are the rounded min and
+    max, and the box and poly can share the same rounded coordinates.
+    """
+    vertices = layout.bounding_poly.normalized_vertices
+
+    return (
+        [round(vertex.x, 5) for vertex in vertices],
+        [round(vertex.y, 5) for vertex in vertices],
+    )
+
+
 def bounding_poly_from_layout(
     layout: Union["documentai.Document.Page.Layout", "documentai.Document.Page.Token"],
 ):
-    return BoundingPoly(
-        normalized_vertices=[
-            Point(x=round(vertex.x, 5), y=round(vertex.y, 5))
-            for vertex in layout.bounding_poly.normalized_vertices
-        ]
+    return BoundingPoly.model_validate(
+        _bounding_poly_data(*_coords_from_layout(layout))
     )
 
 
 def bounding_box_from_layout(
     layout: Union["documentai.Document.Page.Layout", "documentai.Document.Page.Token"],
 ):
-    top = min(vertex.y for vertex in layout.bounding_poly.normalized_vertices)
-    bottom = max(vertex.y for vertex in layout.bounding_poly.normalized_vertices)
-
-    left = min(vertex.x for vertex in layout.bounding_poly.normalized_vertices)
-    right = max(vertex.x for vertex in layout.bounding_poly.normalized_vertices)
-
-    return NormBBox(
-        x0=round(left, 5),
-        top=round(top, 5),
-        x1=round(right, 5),
-        bottom=round(bottom, 5),
-    )
+    return NormBBox.model_validate(_bounding_box_data(*_coords_from_layout(layout)))
 
 
 def geometry_from_layout(
     layout: Union["documentai.Document.Page.Layout", "documentai.Document.Page.Token"],
     exclude_bounding_poly: bool = False,
 ):
-    bounding_poly = None if exclude_bounding_poly else bounding_poly_from_layout(layout)
+    xs, ys = _coords_from_layout(layout)
 
-    bounding_box = bounding_box_from_layout(layout)
+    bounding_poly = (
+        None
+        if exclude_bounding_poly
+        else BoundingPoly.model_validate(_bounding_poly_data(xs, ys))
+    )
 
     return {
         "bounding_poly": bounding_poly,
-        "bounding_box": bounding_box,
+        "bounding_box": NormBBox.model_validate(_bounding_box_data(xs, ys)),
     }
 
 
+def _ordered_text_segments(
+    text_anchor: "documentai.Document.TextAnchor",
+) -> Sequence["documentai.Document.TextAnchor.TextSegment"]:
+    """
+    Segments are almost always a single span, in which case there is nothing to sort
+    """
+    segments = text_anchor.text_segments
+
+    if len(segments) <= 1:
+        return segments
+
+    return sorted(segments, key=lambda x: x.end_index)
+
+
 def text_from_layout(
     layout: Union["documentai.Document.Page.Layout", "documentai.Document.Page.Token"],
     document_text: str,
@@ -147,16 +204,46 @@ def text_from_layout(
     """
     Offset is used to account for the fact that text references
     are relative to the entire document.
+
+    Indices count characters rather than UTF-8 bytes, so the slicing is done on the
+    decoded text and the segments are joined in a single allocation.
+
+    If the processor inlined the text on the anchor, it is used directly.
     """
-    working_text = ""
+    text_anchor = layout.text_anchor
+    content = text_anchor.content
+
+    if content:
+        return content
+
+    segments = _ordered_text_segments(text_anchor)
+
+    if len(segments) == 1:
+        segment = segments[0]
+
+        return document_text[segment.start_index - offset : segment.end_index - offset]
 
-    for segment in sorted(layout.text_anchor.text_segments, key=lambda x: x.end_index):
-        start = getattr(segment, "start_index", 0)
-        end = segment.end_index
+    return "".join(
+        [
+            document_text[segment.start_index - offset : segment.end_index - offset]
+            for segment in segments
+        ]
+    )
 
-        working_text += document_text[start - offset : end - offset]
 
-    return working_text
+def _text_span_data(
+    layout: Union["documentai.Document.Page.Layout", "documentai.Document.Page.Token"],
+    level: Literal["page", "document"],
+    offset: int = 0,
+) -> List[Dict[str, Any]]:
+    return [
+        {
+            "start_index": segment.start_index - offset,
+            "end_index": segment.end_index - offset,
+            "level": level,
+        }
+        for segment in _ordered_text_segments(layout.text_anchor)
+    ]
 
 
 def text_spans_from_layout(
@@ -164,21 +251,67 @@ def text_spans_from_layout(
     level: Literal["page", "document"],
     offset: int = 0,
 ) -> List[TextSpan]:
-    text_spans = []
+    return [
+        TextSpan.model_validate(span)
+        for span in _text_span_data(layout, level, offset=offset)
+    ]
+
+
+def _text_blocks_from_items(
+    items: Iterable[
+        Union[
+            "documentai.Document.Page.Token",
+            "documentai.Document.Page.Line",
+            "documentai.Document.Page.Block",
+        ]
+    ],
+    document_text: str,
+    block_type: SegmentLevels,
+    offset_low: int,
+    exclude_bounding_poly: bool,
+) -> List[TextBlock]:
+    validate_text_block = TextBlock.model_validate
+
+    text_blocks = []
 
-    for segment in sorted(layout.text_anchor.text_segments, key=lambda x: x.end_index):
-        start = getattr(segment, "start_index", 0)
-        end = segment.end_index
+    for item in items:
+        layout = item.layout
+        xs, ys = _coords_from_layout(layout)
+        orientation = layout.orientation
 
-        text_spans.append(
-            TextSpan(
-                start_index=start - offset,
-                end_index=end - offset,
-                level=level,
+        text_blocks.append(
+            validate_text_block(
+                {
+                    "text": text_from_layout(layout, document_text),
+                    "type": block_type,
+                    "bounding_box": _bounding_box_data(xs, ys),
+                    "bounding_poly": None
+                    if exclude_bounding_poly
+                    else _bounding_poly_data(xs, ys),
+                    "metadata": {
+                        "direction": _orientation_directions[orientation]
+                        if 0 <= orientation < 5
+                        else "UP",
+                        "confidence": round(layout.confidence, 5),
+                    },
+                    "text_spans": _text_span_data(
+                        layout, level="page", offset=offset_low
+                    ),
+                }
             )
         )
 
-    return text_spans
+    return text_blocks
+
+
+def page_text_offset(page: "documentai.Document.Page") -> int:
+    """
+    Text references are relative to the entire document, while we need to compute spans
+    relative to the page. This is the index of the page's first character in the document text.
+    """
+    segments = page.layout.text_anchor.text_segments
+
+    return segments[0].start_index if segments else 0
 
 
 def text_blocks_from_page(
@@ -188,39 +321,55 @@ def text_blocks_from_page(
     *,
     exclude_bounding_poly: bool = False,
 ) -> List[TextBlock]:
-    text_blocks = []
+    return _text_blocks_from_items(
+        getattr(page, f"{type}s"),
+        document_text,
+        type_mapping[type],
+        page_text_offset(page),
+        exclude_bounding_poly,
+    )
 
-    # Offset is used to account for the fact that text references are relative to the entire document.
-    # while we need to compute spans relative to the page.
-    offset_low = page.layout.text_anchor.text_segments[0].start_index or 0
 
-    for item in getattr(page, f"{type}s"):
-        layout = item.layout
-        block_text = text_from_layout(layout, document_text)
-        geometry_kwargs = geometry_from_layout(
-            layout, exclude_bounding_poly=exclude_bounding_poly
-        )
-        confidence = layout.confidence
-        orientation = orientation_mapping.get(layout.orientation, "UP")
+def _raw_message(message):
+    """
+    Returns the underlying protobuf message of a proto-plus wrapper.
 
-        text_spans = text_spans_from_layout(layout, level="page", offset=offset_low)
+    proto-plus marshals every attribute access through Python descriptors, while the raw
+    message reads fields directly, which matters in the per-block loops. The field names
+    read by the parsing helpers are the same on both.
+    """
+    to_pb = getattr(type(message), "pb", None)
 
-        block_type = type_mapping[type]
-        text_blocks.append(
-            TextBlock(
-                text=block_text,
-                type=block_type,
-                bounding_box=geometry_kwargs["bounding_box"],
-                bounding_poly=geometry_kwargs["bounding_poly"],
-                metadata=TextBlockMetadata(
-                    direction=orientation,
-                    confidence=round(confidence, 5),
-                ),
-                text_spans=text_spans,
-            )
-        )
+    return to_pb(message) if to_pb is not None else message
 
-    return text_blocks
+
+def all_text_blocks_from_page(
+    page: "documentai.Document.Page",
+    document_text: str,
+    *,
+    offset_low: Optional[int] = None,
+    exclude_bounding_poly: bool = False,
+) -> Tuple[List[TextBlock], List[TextBlock], List[TextBlock]]:
+    """
+    Builds the word, line and block level text blocks for a page in one sweep,
+    sharing the page offset between the three levels.
+    """
+    page = _raw_message(page)
+
+    if offset_low is None:
+        offset_low = page_text_offset(page)
+
+    word_blocks = _text_blocks_from_items(
+        page.tokens, document_text, "word", offset_low, exclude_bounding_poly
+    )
+    line_blocks = _text_blocks_from_items(
+        page.lines, document_text, "line", offset_low, exclude_bounding_poly
+    )
+    block_blocks = _text_blocks_from_items(
+        page.blocks, document_text, "block", offset_low, exclude_bounding_poly
+    )
+
+    return word_blocks, line_blocks, block_blocks
 
 
 def metadata_from_page(page: "documentai.Document.Page") -> GCPPageMetadata:
@@ -255,18 +404,15 @@ def process_page(
     exclude_bounding_poly: bool = False,
     return_image: bool = False,
 ) -> OcrPageResult:
-    layout = page.layout
+    page_pb = _raw_message(page)
 
-    page_text = text_from_layout(layout, document_text)
+    page_text = text_from_layout(page_pb.layout, document_text)
 
-    word_boxes = text_blocks_from_page(
-        page, document_text, "token", exclude_bounding_poly=exclude_bounding_poly
-    )
-    line_boxes = text_blocks_from_page(
-        page, document_text, "line", exclude_bounding_poly=exclude_bounding_poly
-    )
-    block_boxes = text_blocks_from_page(
-        page, document_text, "block", exclude_bounding_poly=exclude_bounding_poly
+    word_boxes, line_boxes, block_boxes = all_text_blocks_from_page(
+        page_pb,
+        document_text,
+        offset_low=page_text_offset(page_pb),
+        exclude_bounding_poly=exclude_bounding_poly,
     )
 
     metadata = metadata_from_page(page)
@@ -276,7 +422,8 @@ def process_page(
     else:
         image = None
 
-    return OcrPageResult[GCPPageMetadata](
+    # Every block was validated as it was built, so skip re-checking each list element
+    return OcrPageResult.model_construct(
         provider_name=provider_name,
         document_name=document_name,
         file_hash=file_hash,
@@ -286,7 +433,7 @@ def process_page(
         line_level_blocks=line_boxes,
         block_level_blocks=block_boxes,
         raster_image=image,
-        extra=metadata,
+        extra=metadata.model_dump(mode="json"),
     )
 
 
@@ -323,70 +470,101 @@ def gcp_documents_to_result_single(
     return results
 
 
-def multi_process_page(args):
-    idx, document, provider_name, page_offset, exclude_bounding_poly = args
+# The text of each chunk, set once per worker process by `_init_document_texts`
+_document_texts: Tuple[str, ...] = ()
 
-    results: Dict[int, OcrPageResult] = {}
 
-    for doc_page_num, page in enumerate(document.pages):
-        page_result = process_page(
-            document.text,
-            page,
-            page_offset + doc_page_num,
-            provider_name,
-            exclude_bounding_poly=exclude_bounding_poly,
-        )
+def _init_document_texts(document_texts: Tuple[str, ...]) -> None:
+    global _document_texts
+    _document_texts = document_texts
+
+
+def multi_process_page(args):
+    (
+        document_index,
+        page_bytes,
+        page_number,
+        provider_name,
+        document_name,
+        file_hash,
+        exclude_bounding_poly,
+        return_image,
+    ) = args
 
-        results[page_offset + doc_page_num] = page_result
+    from google.cloud import documentai
 
-    return idx, results
+    page = documentai.Document.Page.deserialize(page_bytes)
+
+    return process_page(
+        _document_texts[document_index],
+        page,
+        page_number,
+        provider_name,
+        document_name,
+        file_hash,
+        exclude_bounding_poly=exclude_bounding_poly,
+        return_image=return_image,
+    )
 
 
 def gcp_documents_to_result_multi(
     documents: List["documentai.Document"],
     provider_name: str,
+    document_name: str,
+    file_hash: str,
     *,
     exclude_bounding_poly: bool = False,
     return_images: bool = False,
 ):
-    tasks = []
-    page_offset = 1  # Pages are 1-indexed
-
-    # Prepare tasks for processing, each with a document index
-    for idx, document in enumerate(documents):
-        args = (
-            idx,
-            document,
-            provider_name,
-            page_offset,
-            exclude_bounding_poly,
-        )
-        tasks.append(args)
-        page_offset += len(document.pages)
+    """
+    Parses every page in a separate process. Pages are independent, so they are shipped
+    to the workers as serialized protobufs along with the index of their chunk. The chunk
+    texts are sent to each worker once, rather than with every page.
+    """
 
-    document_results = [None] * len(documents)
+    def iter_tasks():
+        page_number = 1  # Pages are 1-indexed
+
+        for document_index, document in enumerate(documents):
+            serialize_page = type(document).Page.serialize
+
+            for page in document.pages:
+                yield (
+                    document_index,
+                    serialize_page(page),
+                    page_number,
+                    provider_name,
+                    document_name,
+                    file_hash,
+                    exclude_bounding_poly,
+                    return_images,
+                )
 
-    worker_count = min(len(documents), min(4, max(multiprocessing.cpu_count(), 1)))
+                page_number += 1
 
-    futures = []
+    total_pages = sum(len(document.pages) for document in documents)
 
-    ctx = multiprocessing.get_context("spawn")
+    worker_count = min(total_pages, max(multiprocessing.cpu_count(), 1))
 
-    with tqdm.tqdm(total=len(documents), desc="Processing documents") as pbar:
-        with ProcessPoolExecutor(max_workers=worker_count, mp_context=ctx) as executor:
-            for task in tasks:
-                future = executor.submit(multi_process_page, task)
-                future.add_done_callback(lambda x: pbar.update(1))
-                futures.append(future)
-
-            for future in as_completed(futures):
-                idx, page_results = future.result()
-                document_results[idx] = page_results
+    ctx = multiprocessing.get_context("spawn")
 
     results: Dict[int, OcrPageResult] = {}
 
-    for document_result in document_results:
-        results.update(document_result)  # type: ignore
+    with tqdm.tqdm(total=total_pages, desc="Processing pages") as pbar:
+        with ProcessPoolExecutor(
+            max_workers=worker_count,
+            mp_context=ctx,
+            initializer=_init_document_texts,
+            initargs=(tuple(document.text for document in documents),),
+        ) as executor:
+            # `map` yields in task order, and page results don't carry their page number
+            page_results = executor.map(multi_process_page, iter_tasks(), chunksize=4)
+
+            for page_number, page_result in zip(
+                range(1, total_pages + 1), page_results
+            ):
+                results[page_number] = page_result
+                pbar.update(1)
 
     return results
 
@@ -401,8 +579,12 @@ def gcp_documents_to_result(
     exclude_bounding_poly: bool = False,
     return_images: bool = False,
 ) -> Dict[int, OcrPageResult]:
-    if mode == "single" or len(documents) == 1 or multiprocessing.cpu_count() == 1:
-        logger.info("Using single process")
+    if (
+        mode == "single"
+        or sum(len(document.pages) for document in documents) <= 1
+        or multiprocessing.cpu_count() == 1
+    ):
+        logger.debug("Using single process")
         return gcp_documents_to_result_single(
             documents,
             provider_name,
@@ -412,10 +594,12 @@ def gcp_documents_to_result(
             return_images=return_images,
         )
     elif mode == "multi":
-        logger.info("Using multiprocessing")
+        logger.debug("Using multiprocessing")
         return gcp_documents_to_result_multi(
             documents,
             provider_name,
+            document_name,
+            file_hash,
             exclude_bounding_poly=exclude_bounding_poly,
             return_images=return_images,
         )
@@ -447,8 +631,15 @@ class GoogleOcrProvider(BaseOCRProvider):
     exclude_bounding_poly: bool = Field(False)
     return_images: bool = Field(False)
     return_image_quality_scores: bool = Field(False)
+    parse_mode: Literal["single", "multi"] = Field(
+        "single",
+        description="Whether to parse the OCR response in a single process, or across a process pool",
+    )
 
     _documentai: "documentai.DocumentProcessorServiceClient" = PrivateAttr()
+    _client: Optional["documentai.DocumentProcessorServiceClient"] = PrivateAttr(
+        default=None
+    )
 
     def __init__(
         self,
@@ -474,7 +665,44 @@ class GoogleOcrProvider(BaseOCRProvider):
                 "Please install 'google-cloud-documentai' to use the GoogleCloudVisionTextExtractionProvider"
             )
 
+    @property
+    def client(self) -> "documentai.DocumentProcessorServiceClient":
+        """
+        The sync DocumentAI client, created once and reused so the credentials and gRPC
+        channel are shared across invocations
+        """
+        if self._client is None:
+            with documentai_client_init_lock:
+                if self._client is None:
+                    self._client = self.get_documentai_client()
+
+        return self._client
+
+    @cached_property
+    def processor_name(self) -> str:
+        return self._documentai.DocumentProcessorServiceClient.processor_path(
+            project=self.project_id,
+            location=self.location,
+            processor=self.processor_id,
+        )
+
     def get_documentai_client(self, client_option_kwargs: dict = {}, **kwargs):
+        return self._get_documentai_client(
+            self._documentai.DocumentProcessorServiceClient,
+            client_option_kwargs,
+            **kwargs,
+        )
+
+    def get_documentai_async_client(self, client_option_kwargs: dict = {}, **kwargs):
+        return self._get_documentai_client(
+            self._documentai.DocumentProcessorServiceAsyncClient,
+            client_option_kwargs,
+            **kwargs,
+        )
+
+    def _get_documentai_client(
+        self, client_cls, client_option_kwargs: dict = {}, **kwargs
+    ):
         from google.api_core.client_options import ClientOptions
 
         opts = ClientOptions(
@@ -490,13 +718,13 @@ class GoogleOcrProvider(BaseOCRProvider):
         }
 
         if self.service_account_info is not None:
-            return self._documentai.DocumentProcessorServiceClient.from_service_account_info(
+            return client_cls.from_service_account_info(
                 info=self.service_account_info,
                 **base_service_client_kwargs,
             )
         elif self.service_account_file is not None:
             with service_account_file_read_lock:
-                return self._documentai.DocumentProcessorServiceClient.from_service_account_file(
+                return client_cls.from_service_account_file(
                     filename=self.service_account_file,
                     **base_service_client_kwargs,
                 )
@@ -513,17 +741,52 @@ class GoogleOcrProvider(BaseOCRProvider):
             )
         )
 
+    def _get_field_mask_paths(self) -> List[str]:
+        """
+        Only request the parts of the response that are parsed into OCR results
+        """
+        paths = ["text", "pages.layout", "pages.tokens", "pages.lines", "pages.blocks"]
+
+        if self.return_images:
+            paths.append("pages.image")
+
+        if self.return_image_quality_scores:
+            paths.append("pages.image_quality_scores")
+
+        return paths
+
+    def _get_process_request_template(
+        self, processor_name: str
+    ) -> "documentai.ProcessRequest":
+        """
+        Everything but the document content is the same for each chunk, so it is built once
+        """
+        return self._documentai.ProcessRequest(
+            name=processor_name,
+            process_options=self._get_process_options(),
+            field_mask={"paths": self._get_field_mask_paths()},
+        )
+
+    def _get_process_request(
+        self, request_template: "documentai.ProcessRequest", split_bytes: bytes
+    ) -> "documentai.ProcessRequest":
+        request_cls = self._documentai.ProcessRequest
+
+        request = request_cls()
+        request_cls.copy_from(request, request_template)
+
+        request.raw_document.content = split_bytes
+        request.raw_document.mime_type = "application/pdf"
+
+        return request
+
     def _process_document_sync(self, document: Document):
         """
         Split the document into chunks of 15 pages or less, and process each chunk
         synchronously.
         """
-        client = self.get_documentai_client()
-        processor_name = client.processor_path(
-            project=self.project_id,
-            location=self.location,
-            processor=self.processor_id,
-        )
+        client = self.client
+        request_template = self._get_process_request_template(self.processor_name)
 
         documents: List["documentai.Document"] = []
 
@@ -531,26 +794,7 @@ class GoogleOcrProvider(BaseOCRProvider):
 
         @default_retry_decorator
         def process_byte_chunk(split_bytes: bytes) -> "documentai.Document":
-            raw_document = self._documentai.RawDocument(
-                content=split_bytes,
-                mime_type="application/pdf",
-            )
-
-            field_mask = (
-                "text,pages.layout,pages.words,pages.lines,pages.tokens,pages.blocks"
-            )
-
-            if self.return_images:
-                field_mask += ",pages.image"
-
-            if self.return_image_quality_scores:
-                field_mask += ",image_quality_scores"
-
-            request = self._documentai.ProcessRequest(
-                name=processor_name,
-                raw_document=raw_document,
-                process_options=self._get_process_options(),
-            )
+            request = self._get_process_request(request_template, split_bytes)
 
             result = client.process_document(request=request)
 
@@ -575,6 +819,7 @@ class GoogleOcrProvider(BaseOCRProvider):
             self.name,
             document_name=document.name,
             file_hash=document.document_hash,
+            mode=self.parse_mode,
             exclude_bounding_poly=self.exclude_bounding_poly,
             return_images=self.return_images,
         )
@@ -587,12 +832,8 @@ class GoogleOcrProvider(BaseOCRProvider):
         include_raster: bool = False,
     ):
         # Process page chunks concurrently
-        client = self.get_documentai_client()
-        processor_name = client.processor_path(
-            project=self.project_id,
-            location=self.location,
-            processor=self.processor_id,
-        )
+        client = self.client
+        request_template = self._get_process_request_template(self.processor_name)
 
         file_bytes = document.file_bytes
 
@@ -600,71 +841,130 @@ class GoogleOcrProvider(BaseOCRProvider):
             logger.info("Document has few pages but is large, compressing first")
             file_bytes = document.to_compressed_bytes()
 
-        logger.info("Splitting document into chunks...")
-        document_byte_splits = list(
-            pdf_split_iter_with_max_bytes(
-                file_bytes,
-                max_page_count=self.max_page_count,
-                max_bytes=self.max_bytes_per_request,
-            )
-        )
-
-        max_workers = min(len(document_byte_splits), self.max_workers)
-
         @default_retry_decorator
         def process_byte_chunk(split_bytes: bytes):
-            raw_document = self._documentai.RawDocument(
-                content=split_bytes,
-                mime_type="application/pdf",
-            )
+            request = self._get_process_request(request_template, split_bytes)
 
-            field_mask = (
-                "text,pages.layout,pages.words,pages.lines,pages.tokens,pages.blocks"
-            )
+            result = client.process_document(request=request)
+
+            document = result.document
+
+            return document
+
+        # Chunks are submitted as they are split, and the semaphore caps how many are held
+        # in memory at once, rather than materializing every chunk up front
+        semaphore = BoundedSemaphore(self.max_workers)
+
+        def on_chunk_done(_future):
+            semaphore.release()
+            pbar.update(1)
+
+        # Chunks are sized by bytes as they are split, so the chunk count isn't known up front
+        logger.debug("Processing document chunks...")
+        with tqdm.tqdm(desc="Processing document") as pbar:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                futures = []
+
+                for split in pdf_split_iter_with_max_bytes(
+                    file_bytes,
+                    max_page_count=self.max_page_count,
+                    max_bytes=self.max_bytes_per_request,
+                ):
+                    semaphore.acquire()
+
+                    future = executor.submit(process_byte_chunk, split)
+                    future.add_done_callback(on_chunk_done)
+
+                    futures.append(future)
+
+                # Futures are kept in submission order, so the results line up with the chunks
+                documents: List["documentai.Document"] = [
+                    future.result() for future in futures
+                ]
+
+        logger.debug("Recombining OCR results...")
+        return gcp_documents_to_result(
+            documents,
+            self.name,
+            document_name=document.name,
+            file_hash=document.document_hash,
+            mode=self.parse_mode,
+            exclude_bounding_poly=self.exclude_bounding_poly,
+            return_images=self.return_images,
+        )
 
-            if self.return_images:
-                field_mask += ",pages.image"
+    async def _process_document_async(
+        self,
+        document: Document,
+        start: Optional[int] = None,
+        stop: Optional[int] = None,
+    ):
+        """
+        Process page chunks concurrently on the event loop using the async DocumentAI client,
+        with at most `max_workers` requests in flight.
+        """
+        request_template = self._get_process_request_template(self.processor_name)
 
-            if self.return_image_quality_scores:
-                field_mask += ",image_quality_scores"
+        file_bytes = document.file_bytes
 
-            request = self._documentai.ProcessRequest(
-                name=processor_name,
-                raw_document=raw_document,
-                process_options=self._get_process_options(),
+        if document.bytes_per_page > 1024 * 1024 * 2:
+            logger.info("Document has few pages but is large, compressing first")
+            file_bytes = await to_thread(document.to_compressed_bytes)
+
+        logger.debug("Splitting document into chunks...")
+        document_byte_splits = await to_thread(
+            lambda: list(
+                pdf_split_iter_with_max_bytes(
+                    file_bytes,
+                    max_page_count=self.max_page_count,
+                    max_bytes=self.max_bytes_per_request,
+                )
             )
+        )
 
-            result = client.process_document(request=request)
+        semaphore = asyncio.Semaphore(self.max_workers)
 
-            document = result.document
+        # The async client is bound to the running event loop, so one is created per call,
+        # and its gRPC channel is closed once the chunks are processed
+        client = self.get_documentai_async_client()
 
-            return document
+        @default_retry_decorator
+        async def process_byte_chunk(split_bytes: bytes) -> "documentai.Document":
+            request = self._get_process_request(request_template, split_bytes)
 
-        logger.info(f"Processing {len(document_byte_splits)} chunks...")
-        with tqdm.tqdm(
-            total=len(document_byte_splits), desc="Processing document"
-        ) as pbar:
-            with ThreadPoolExecutor(max_workers=max_workers) as executor:
-                future_to_index = {
-                    executor.submit(process_byte_chunk, split): index
-                    for index, split in enumerate(document_byte_splits)
-                }
+            result = await client.process_document(request=request)
+
+            return result.document
 
-                documents: List["documentai.Document"] = [None] * len(
-                    document_byte_splits
-                )  # type: ignore
+        logger.debug("Processing %d chunks...", len(document_byte_splits))
+        try:
+            with tqdm.tqdm(
+                total=len(document_byte_splits), desc="Processing document"
+            ) as pbar:
+
+                async def process_with_limit(
+                    split_bytes: bytes,
+                ) -> "documentai.Document":
+                    async with semaphore:
+                        result = await process_byte_chunk(split_bytes)
 
-                for future in as_completed(future_to_index):
-                    index = future_to_index[future]
-                    documents[index] = future.result()
                     pbar.update(1)
 
-        logger.info("Recombining OCR results...")
+                    return result
+
+                documents: List["documentai.Document"] = await asyncio.gather(
+                    *(process_with_limit(split) for split in document_byte_splits)
+                )
+        finally:
+            await client.transport.close()
+
+        logger.debug("Recombining OCR results...")
         return gcp_documents_to_result(
             documents,
             self.name,
             document_name=document.name,
             file_hash=document.document_hash,
+            mode=self.parse_mode,
             exclude_bounding_poly=self.exclude_bounding_poly,
             return_images=self.return_images,
         )
@@ -684,6 +984,21 @@ class GoogleOcrProvider(BaseOCRProvider):
 
         return self._process_document_concurrent(input[0], start=start, stop=stop)
 
+    async def _ainvoke(
+        self,
+        input: List[PdfDocument],
+        config: None = None,
+        start: Optional[int] = None,
+        stop: Optional[int] = None,
+        **kwargs,
+    ):
+        if len(input) != 1:
+            raise ValueError(
+                "GoogleOcrProvider only supports processing a single document at a time."
+            )
+
+        return await self._process_document_async(input[0], start=start, stop=stop)
+
     def process_document_node(
         self,
         document_node: "DocumentNode",
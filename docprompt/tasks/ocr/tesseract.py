@@ -99,7 +99,7 @@ def _tesseract_result_to_page_result(result: TesseractResult) -> OcrPageResult:
 
     page_text = " ".join(block["text"] for block in result["blocks"])
 
-    return OcrPageResult(
+    return OcrPageResult.model_construct(
         provider_name="tesseract",
         page_number=-1,  # Set to 0 because we don't know the page number
         page_text=page_text,
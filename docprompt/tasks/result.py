@@ -75,4 +75,8 @@ class ResultContainer(BaseModel, Generic[PageOrDocumentTaskResult]):
 
     @property
     def result(self):
-        return next(iter(self.results.values()), None)
+        # Containers stay empty until a provider runs, so answer that case without an iterator
+        if not self.results:
+            return None
+
+        return next(iter(self.results.values()))
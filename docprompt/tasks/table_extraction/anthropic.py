@@ -15,6 +15,8 @@ from .schema import (
     TableRow,
 )
 
+DEFAULT_MODEL_NAME = "claude-3-haiku-20240307"
+
 SYSTEM_PROMPT = """
 You are given an image. Identify and extract all tables from the document.
 
@@ -128,10 +130,14 @@ class AnthropicTableExtractionProvider(BaseTableExtractionProvider):
     name = "anthropic"
 
     async def _ainvoke(
-        self, input: Iterable[bytes], config: Optional[None] = None
+        self, input: Iterable[bytes], config: Optional[None] = None, **kwargs
     ) -> List[TableExtractionPageResult]:
         messages = await _prepare_messages(input)
 
-        completions = await inference.run_batch_inference_anthropic(messages)
+        model_name = kwargs.pop("model_name", DEFAULT_MODEL_NAME)
+
+        completions = await inference.run_batch_inference_anthropic(
+            model_name, messages, **kwargs
+        )
 
         return [parse_response(x, provider_name=self.name) for x in completions]
@@ -27,15 +27,16 @@ class BaseTableExtractionProvider(
         contribute_to_document: bool = True,
         **kwargs,
     ):
-        raster_bytes = []
-        for page_number in range(start or 1, (stop or len(document_node)) + 1):
-            image_bytes = document_node.page_nodes[
-                page_number - 1
-            ].rasterizer.rasterize("default")
-            raster_bytes.append(image_bytes)
+        # Render every requested page in one batched call rather than one page at a time
+        raster_bytes = document_node.rasterizer.rasterize(
+            "default",
+            page_numbers=range(start or 1, (stop or len(document_node)) + 1),
+        )
 
         # This will be a list of extracted tables??
-        results = self._invoke(raster_bytes, config=task_config, **kwargs)
+        # Go through `invoke` so the provider's default invoke kwargs (credentials, model)
+        # reach the batch alongside any per-call overrides
+        results = self.invoke(raster_bytes, config=task_config, **kwargs)
 
         return {
             i: res
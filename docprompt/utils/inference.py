@@ -2,7 +2,7 @@
 
 import asyncio
 import os
-from typing import List
+from typing import TYPE_CHECKING, List, Optional
 
 from tenacity import (
     retry,
@@ -14,6 +14,12 @@ from tqdm.asyncio import tqdm
 
 from docprompt.tasks.message import OpenAIComplexContent, OpenAIMessage
 
+if TYPE_CHECKING:
+    from anthropic import AsyncAnthropic
+
+
+DEFAULT_MAX_CONCURRENCY = 16
+
 
 def get_anthropic_retry_decorator():
     import anthropic
@@ -41,14 +47,23 @@ def get_openai_retry_decorator():
     )
 
 
+def get_anthropic_client(api_key: Optional[str] = None) -> "AsyncAnthropic":
+    from anthropic import AsyncAnthropic
+
+    return AsyncAnthropic(api_key=api_key or os.environ.get("ANTHROPIC_API_KEY"))
+
+
 async def run_inference_anthropic(
-    model_name: str, messages: List[OpenAIMessage], **kwargs
+    model_name: str,
+    messages: List[OpenAIMessage],
+    client: Optional["AsyncAnthropic"] = None,
+    **kwargs,
 ) -> str:
     """Run inference using an Anthropic model asynchronously."""
-    from anthropic import AsyncAnthropic
+    api_key = kwargs.pop("api_key", None)
 
-    api_key = kwargs.pop("api_key", os.environ.get("ANTHROPIC_API_KEY"))
-    client = AsyncAnthropic(api_key=api_key)
+    if client is None:
+        client = get_anthropic_client(api_key)
 
     system = None
     if messages and messages[0].role == "system":
@@ -91,20 +106,45 @@ async def run_inference_anthropic(
 
 
 async def run_batch_inference_anthropic(
-    model_name: str, messages: List[List[OpenAIMessage]], **kwargs
+    model_name: str,
+    messages: List[List[OpenAIMessage]],
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    **kwargs,
 ) -> List[str]:
-    """Run batch inference using an Anthropic model asynchronously."""
+    """Run batch inference using an Anthropic model asynchronously.
+
+    At most `max_concurrency` requests are in flight at once.
+    """
     retry_decorator = get_anthropic_retry_decorator()
 
+    # A single client is shared by the whole batch, so every request draws on one
+    # connection pool instead of opening its own connections
+    client = get_anthropic_client(kwargs.pop("api_key", None))
+
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    # The semaphore is taken per attempt, so a request backing off between retries
+    # frees its slot for another page
     @retry_decorator
     async def process_message_set(msg_set):
-        return await run_inference_anthropic(model_name, msg_set, **kwargs)
+        async with semaphore:
+            return await run_inference_anthropic(
+                model_name, msg_set, client=client, **kwargs
+            )
+
+    with tqdm(total=len(messages), desc="Processing messages") as pbar:
+
+        async def process_and_track(msg_set):
+            response = await process_message_set(msg_set)
+
+            pbar.update(1)
 
-    tasks = [process_message_set(msg_set) for msg_set in messages]
+            return response
 
-    responses: List[str] = []
-    for f in tqdm(asyncio.as_completed(tasks), desc="Processing messages"):
-        response = await f
-        responses.append(response)
+        # Results are gathered in submission order, so each response lines up with the
+        # page it was asked about
+        responses: List[str] = await asyncio.gather(
+            *(process_and_track(msg_set) for msg_set in messages)
+        )
 
     return responses
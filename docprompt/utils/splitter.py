@@ -50,6 +50,21 @@ def split_pdf_to_bytes(
         return pdf_bytes_buffer.getvalue()
 
 
+def _pages_to_bytes(src_pdf: pdfium.PdfDocument, start_page: int, stop_page: int):
+    """
+    Copies pages [start_page, stop_page) of an open PDF into a new PDF and returns its bytes
+    """
+    with writable_temp_pdf() as dst_pdf:
+        # Append pages to the batch
+        dst_pdf.import_pages(src_pdf, list(range(start_page, stop_page)))
+
+        # Save the batch PDF to a bytes buffer
+        pdf_bytes_buffer = io.BytesIO()
+        dst_pdf.save(pdf_bytes_buffer)
+
+    return pdf_bytes_buffer.getvalue()
+
+
 def pdf_split_iter_fast(file_bytes: bytes, max_page_count: int) -> Iterator[bytes]:
     """
     Splits a PDF into batches of pages up to `max_page_count` pages quickly.
@@ -62,44 +77,71 @@ def pdf_split_iter_fast(file_bytes: bytes, max_page_count: int) -> Iterator[byte
             # Determine the last page for the current batch
             last_page = min(current_page + max_page_count, total_pages)
 
-            with writable_temp_pdf() as dst_pdf:
-                # Append pages to the batch
-                dst_pdf.import_pages(src_pdf, list(range(current_page, last_page)))
-
-                # Save the batch PDF to a bytes buffer
-                pdf_bytes_buffer = io.BytesIO()
-                dst_pdf.save(pdf_bytes_buffer)
-                pdf_bytes_buffer.seek(0)  # Reset buffer pointer to the beginning
-
             # Yield the bytes of the batch PDF
-            yield pdf_bytes_buffer.getvalue()
+            yield _pages_to_bytes(src_pdf, current_page, last_page)
 
             # Update the current page for the next batch
             current_page += max_page_count
 
 
 def pdf_split_iter_with_max_bytes(
-    file_bytes: bytes, max_page_count: int, max_bytes: int
+    file_bytes: bytes,
+    max_page_count: int,
+    max_bytes: int,
+    *,
+    target_fill_ratio: float = 0.85,
 ) -> Iterator[bytes]:
     """
     Splits a PDF into batches of pages up to `max_page_count` pages and `max_bytes` bytes.
+
+    The number of pages per batch adapts to the size of the batches produced so far, aiming
+    for `target_fill_ratio` of `max_bytes`. Sparse documents ship `max_page_count` pages per
+    batch, while dense documents shrink the batch up front instead of repeatedly producing
+    oversized batches and backing off one page at a time.
     """
-    for batch_bytes in pdf_split_iter_fast(file_bytes, max_page_count):
-        if len(batch_bytes) <= max_bytes:
-            yield batch_bytes
-        else:
-            # If batch size is greater than max_bytes, reduce the number of pages
-            pages_in_batch = max_page_count
-            while len(batch_bytes) > max_bytes and pages_in_batch > 1:
-                pages_in_batch -= 1
-                batch_bytes = next(pdf_split_iter_fast(file_bytes, pages_in_batch))
-
-            if len(batch_bytes) > max_bytes and pages_in_batch == 1:
+    target_bytes = max_bytes * target_fill_ratio
+
+    with get_pdfium_document(file_bytes) as src_pdf:
+        current_page = 0
+        total_pages = len(src_pdf)
+        bytes_per_page: Optional[float] = None
+
+        while current_page < total_pages:
+            remaining_pages = total_pages - current_page
+
+            if bytes_per_page:
+                page_count = int(target_bytes // bytes_per_page)
+            else:
+                page_count = max_page_count
+
+            page_count = max(1, min(page_count, max_page_count, remaining_pages))
+
+            batch_bytes = _pages_to_bytes(
+                src_pdf, current_page, current_page + page_count
+            )
+
+            while len(batch_bytes) > max_bytes and page_count > 1:
+                # Shrink proportionally to the overshoot, by at least one page
+                page_count = max(
+                    1,
+                    min(
+                        page_count - 1,
+                        int(page_count * target_bytes / len(batch_bytes)),
+                    ),
+                )
+                batch_bytes = _pages_to_bytes(
+                    src_pdf, current_page, current_page + page_count
+                )
+
+            bytes_per_page = len(batch_bytes) / page_count
+
+            if len(batch_bytes) > max_bytes:
                 # If a single page is still too large, compress it
                 with tempfile.NamedTemporaryFile(suffix=".pdf") as f:
                     f.write(batch_bytes)
                     f.flush()
-                    compressed_bytes = compress_pdf_to_bytes(f.name)
-                yield compressed_bytes
-            else:
-                yield batch_bytes
+                    batch_bytes = compress_pdf_to_bytes(f.name)
+
+            yield batch_bytes
+
+            current_page += page_count
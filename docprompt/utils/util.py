@@ -1,6 +1,5 @@
 import hashlib
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from io import BytesIO
 from os import PathLike
 from pathlib import Path
 from typing import TYPE_CHECKING, List, Optional, Union
@@ -154,23 +153,17 @@ def hash_from_bytes(
     byte_data: bytes, hash_func=hashlib.md5, threshold=1024 * 1024 * 128
 ) -> str:
     """
-    Gets a hash from bytes. If the bytes are larger than the threshold, the hash is computed in chunks
-    to avoid memory issues. The default hash function is MD5 with a threshold of 128MB which is optimal
-    for most machines and use cases.
+    Gets a hash from bytes. The default hash function is MD5.
+
+    hashlib reads the buffer in place, without copying it, and releases the GIL while hashing
+    large inputs, so the bytes are hashed in a single update. `threshold` is no longer used,
+    and is kept for backwards compatibility.
     """
     if len(byte_data) < 1024 * 1024 * 10:  # 10MB
         return hashlib.md5(byte_data).hexdigest()
 
     hash = hash_func()
 
-    if len(byte_data) > threshold:
-        stream = BytesIO(byte_data)
-        b = bytearray(128 * 1024)
-        mv = memoryview(b)
-
-        while n := stream.readinto(mv):
-            hash.update(mv[:n])
-    else:
-        hash.update(byte_data)
+    hash.update(byte_data)
 
     return hash.hexdigest()
@@ -1,10 +1,18 @@
 import base64
+import concurrent.futures as ft
+import io
 import pickle
+from unittest.mock import patch
 
+import pytest
 from PIL import Image
 
 from docprompt import DocumentNode, load_document
-from docprompt._pdfium import rasterize_pdfs_with_pdfium
+from docprompt._pdfium import (
+    rasterize_page_with_pdfium,
+    rasterize_pdf_with_pdfium,
+    rasterize_pdfs_with_pdfium,
+)
 from tests.fixtures import PDF_FIXTURES
 
 
@@ -55,6 +63,21 @@ def test_rasterize_via_document_node():
     )
 
 
+def test_rasterize_few_pages_in_process():
+    document = load_document(PDF_FIXTURES[0].get_full_path())
+
+    with patch.object(ft, "ProcessPoolExecutor") as mock_executor:
+        images = rasterize_pdf_with_pdfium(
+            document.file_bytes, return_mode="bytes", page_numbers=[2, 1]
+        )
+
+    mock_executor.assert_not_called()
+    assert images == [
+        rasterize_page_with_pdfium(document.file_bytes, 2, return_mode="bytes"),
+        rasterize_page_with_pdfium(document.file_bytes, 1, return_mode="bytes"),
+    ]
+
+
 def test_multi_rasterize():
     document_1 = load_document(PDF_FIXTURES[0].get_full_path())
     document_2 = load_document(PDF_FIXTURES[1].get_full_path())
@@ -103,3 +126,156 @@ def test__pickling_drops_cache():
     loaded = pickle.loads(dumped)
 
     assert not loaded._raster_cache
+
+
+def test_rasterize_pil_returns_independent_images():
+    document = load_document(PDF_FIXTURES[0].get_full_path())
+
+    document_node = DocumentNode.from_document(document)
+
+    page_node = document_node.page_nodes[0]
+
+    image = page_node.rasterizer.rasterize("test", return_mode="pil")
+    size = image.size
+
+    image.thumbnail((10, 10))
+
+    assert page_node.rasterizer.rasterize("test", return_mode="pil").size == size
+
+
+def test_document_rasterize_only_renders_missing_pages():
+    document = load_document(PDF_FIXTURES[0].get_full_path())
+
+    document_node = DocumentNode.from_document(document)
+
+    cached = document_node.page_nodes[0].rasterizer.rasterize("default")
+
+    images = document_node.rasterizer.rasterize("default")
+
+    assert len(images) == len(document_node)
+    assert images[0] is cached
+    assert all(isinstance(image, bytes) for image in images)
+
+
+def test_document_rasterize_subset_of_pages():
+    document = load_document(PDF_FIXTURES[0].get_full_path())
+
+    document_node = DocumentNode.from_document(document)
+
+    images = document_node.rasterizer.rasterize("default", page_numbers=[3, 1])
+
+    assert len(images) == 2
+    assert images[0] is document_node.page_nodes[2].rasterizer.raster_cache["default"]
+    assert images[1] is document_node.page_nodes[0].rasterizer.raster_cache["default"]
+    assert "default" not in document_node.page_nodes[1].rasterizer.raster_cache
+
+
+@pytest.mark.parametrize("page_number", [0, -1, 1000])
+def test_document_rasterize_rejects_out_of_range_pages(page_number):
+    document = load_document(PDF_FIXTURES[0].get_full_path())
+
+    document_node = DocumentNode.from_document(document)
+
+    with pytest.raises(ValueError, match="between 1 and"):
+        document_node.rasterizer.rasterize("default", page_numbers=[page_number])
+
+
+def test_document_rasterize_bytes_after_pil():
+    document = load_document(PDF_FIXTURES[0].get_full_path())
+
+    document_node = DocumentNode.from_document(document)
+
+    pil_images = document_node.rasterizer.rasterize("default", return_mode="pil")
+    images = document_node.rasterizer.rasterize("default", return_mode="bytes")
+
+    assert all(isinstance(image, Image.Image) for image in pil_images)
+    assert all(isinstance(image, bytes) for image in images)
+
+
+def test_document_rasterize_pil_returns_independent_images():
+    document = load_document(PDF_FIXTURES[0].get_full_path())
+
+    document_node = DocumentNode.from_document(document)
+
+    image = document_node.rasterizer.rasterize(
+        "default", return_mode="pil", page_numbers=[1]
+    )[0]
+    size = image.size
+
+    image.thumbnail((10, 10))
+
+    assert isinstance(document_node.page_nodes[0].rasterizer.raster_cache["default"], bytes)
+    assert (
+        document_node.rasterizer.rasterize(
+            "default", return_mode="pil", page_numbers=[1]
+        )[0].size
+        == size
+    )
+
+
+def test_document_rasterize_rerenders_with_new_parameters():
+    document = load_document(PDF_FIXTURES[0].get_full_path())
+
+    document_node = DocumentNode.from_document(document)
+
+    low = document_node.rasterizer.rasterize("default", dpi=20, page_numbers=[1])
+    high = document_node.rasterizer.rasterize("default", dpi=40, page_numbers=[1])
+
+    assert Image.open(io.BytesIO(high[0])).size != Image.open(io.BytesIO(low[0])).size
+    assert document_node.page_nodes[0].rasterizer.raster_cache["default"] is high[0]
+
+
+def test_persist_and_load_from_storage(tmp_path):
+    document = load_document(PDF_FIXTURES[0].get_full_path())
+
+    document_node = DocumentNode.from_document(document)
+
+    document_node.metadata["foo"] = "bar"
+    document_node.page_nodes[0].metadata["page"] = 1
+
+    document_node.persist(str(tmp_path))
+
+    loaded = DocumentNode.from_storage(str(tmp_path), document.document_hash)
+
+    assert loaded.document.document_hash == document.document_hash
+    assert loaded.metadata["foo"] == "bar"
+    assert loaded.page_nodes[0].metadata["page"] == 1
+    assert len(loaded.page_nodes) == len(document_node.page_nodes)
+
+
+def test_persist_many_and_load_from_storage_many(tmp_path):
+    documents = [load_document(fixture.get_full_path()) for fixture in PDF_FIXTURES[:2]]
+
+    document_nodes = [DocumentNode.from_document(document) for document in documents]
+
+    for idx, document_node in enumerate(document_nodes):
+        document_node.metadata["idx"] = idx
+
+    path_managers = DocumentNode.persist_many(document_nodes, str(tmp_path))
+
+    assert len(path_managers) == len(document_nodes)
+    assert all(node.persistance_path == str(tmp_path) for node in document_nodes)
+
+    hashes = [document.document_hash for document in reversed(documents)]
+
+    loaded = DocumentNode.from_storage_many(str(tmp_path), hashes)
+
+    assert [node.document.document_hash for node in loaded] == hashes
+    assert [node.metadata["idx"] for node in loaded] == [1, 0]
+    assert all(node.persistance_path == str(tmp_path) for node in loaded)
+
+
+@pytest.mark.asyncio
+async def test_apersist_and_afrom_storage(tmp_path):
+    document = load_document(PDF_FIXTURES[0].get_full_path())
+
+    document_node = DocumentNode.from_document(document)
+    document_node.metadata["foo"] = "bar"
+
+    await document_node.apersist(str(tmp_path))
+
+    loaded = await DocumentNode.afrom_storage(str(tmp_path), document.document_hash)
+
+    assert loaded.document.document_hash == document.document_hash
+    assert loaded.metadata["foo"] == "bar"
+    assert loaded.persistance_path == str(tmp_path)
@@ -81,6 +81,15 @@ def test_rasterize_invalid_page():
     document.rasterize_page(len(document))  # Should rasterize last page
 
 
+def test_rasterize_pdf__keyed_by_page_number():
+    document = load_document(PDF_FIXTURES[0].get_full_path())
+
+    rastered = document.rasterize_pdf(dpi=20)
+
+    assert list(rastered) == list(range(1, len(document) + 1))
+    assert document.rasterize_pdf_pages([2, 1], dpi=20) == [rastered[2], rastered[1]]
+
+
 def test_rasterize_convert_and_quantize():
     # Fow now just test PIL can open the image
     convert_mode = "L"
@@ -0,0 +1,3 @@
+"""
+Test the functionality of the OCR task providers.
+"""
@@ -0,0 +1,62 @@
+from google.cloud import documentai
+
+from docprompt.tasks.ocr.gcp import gcp_documents_to_result_multi
+
+TEXT = "Hello\nWorld\n"
+
+
+def _layout(start: int, end: int):
+    return documentai.Document.Page.Layout(
+        text_anchor=documentai.Document.TextAnchor(
+            text_segments=[
+                documentai.Document.TextAnchor.TextSegment(
+                    start_index=start, end_index=end
+                )
+            ]
+        ),
+        bounding_poly=documentai.BoundingPoly(
+            normalized_vertices=[
+                documentai.NormalizedVertex(x=0.1, y=0.1),
+                documentai.NormalizedVertex(x=0.5, y=0.1),
+                documentai.NormalizedVertex(x=0.5, y=0.2),
+                documentai.NormalizedVertex(x=0.1, y=0.2),
+            ]
+        ),
+        confidence=0.9,
+    )
+
+
+def _page(start: int, end: int):
+    layout = _layout(start, end)
+
+    return documentai.Document.Page(
+        layout=layout,
+        tokens=[documentai.Document.Page.Token(layout=layout)],
+        lines=[documentai.Document.Page.Line(layout=layout)],
+        blocks=[documentai.Document.Page.Block(layout=layout)],
+    )
+
+
+def test_gcp_documents_to_result_multi__keys_results_by_page_number():
+    document = documentai.Document(text=TEXT, pages=[_page(0, 6), _page(6, 12)])
+
+    results = gcp_documents_to_result_multi(
+        [document], "gcp_documentai", "test.pdf", "hash"
+    )
+
+    assert list(results) == [1, 2]
+    assert results[1].page_text == "Hello\n"
+    assert results[2].page_text == "World\n"
+    assert [block.text for block in results[2].word_level_blocks] == ["World\n"]
+
+
+def test_gcp_documents_to_result_multi__reads_each_chunk_text():
+    first = documentai.Document(text=TEXT, pages=[_page(0, 6)])
+    second = documentai.Document(text="Other\n", pages=[_page(0, 6)])
+
+    results = gcp_documents_to_result_multi(
+        [first, second], "gcp_documentai", "test.pdf", "hash"
+    )
+
+    assert results[1].page_text == "Hello\n"
+    assert results[2].page_text == "Other\n"
@@ -0,0 +1,3 @@
+"""
+Test the functionality of the table extraction task provider.
+"""
@@ -0,0 +1,49 @@
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from docprompt.tasks.table_extraction.anthropic import (
+    DEFAULT_MODEL_NAME,
+    AnthropicTableExtractionProvider,
+)
+from docprompt.tasks.table_extraction.schema import TableExtractionPageResult
+
+# No <table> tags, so parsing does not need an XML parser backend
+RESPONSE = "There are no tables on this page."
+
+
+@pytest.mark.asyncio
+async def test_ainvoke_forwards_default_invoke_kwargs():
+    provider = AnthropicTableExtractionProvider(invoke_kwargs={"api_key": "key"})
+
+    with patch(
+        "docprompt.utils.inference.run_batch_inference_anthropic",
+        new_callable=AsyncMock,
+    ) as mock_inference:
+        mock_inference.return_value = [RESPONSE]
+
+        results = await provider.ainvoke([b"image"])
+
+    args, kwargs = mock_inference.call_args
+    assert args[0] == DEFAULT_MODEL_NAME
+    assert len(args[1]) == 1
+    assert kwargs == {"api_key": "key"}
+
+    assert isinstance(results[0], TableExtractionPageResult)
+    assert results[0].tables == []
+    assert results[0].provider_name == "anthropic"
+
+
+@pytest.mark.asyncio
+async def test_ainvoke_model_name_override():
+    provider = AnthropicTableExtractionProvider(invoke_kwargs={"api_key": "key"})
+
+    with patch(
+        "docprompt.utils.inference.run_batch_inference_anthropic",
+        new_callable=AsyncMock,
+    ) as mock_inference:
+        mock_inference.return_value = [RESPONSE]
+
+        await provider.ainvoke([b"image"], model_name="claude-3-5-sonnet-20240620")
+
+    assert mock_inference.call_args.args[0] == "claude-3-5-sonnet-20240620"
@@ -6,7 +6,12 @@ from unittest.mock import MagicMock
 
 from docprompt import DocumentNode
 from docprompt.schema.pipeline import BaseMetadata
-from docprompt.tasks.result import BaseDocumentResult, BasePageResult, BaseResult
+from docprompt.tasks.result import (
+    BaseDocumentResult,
+    BasePageResult,
+    BaseResult,
+    ResultContainer,
+)
 
 
 def test_task_key():
@@ -58,3 +63,18 @@ def test_base_page_result_contribution():
     result.contribute_to_document_node(mock_node, page_number=1)
 
     assert mock_node.page_nodes[0].metadata.task_results["test_test"] == result
+
+
+def test_result_container_result():
+    class TestPageResult(BasePageResult):
+        task_name = "test"
+
+    container = ResultContainer()
+
+    assert container.result is None
+
+    first = TestPageResult(provider_name="first")
+    container.results["first"] = first
+    container.results["second"] = TestPageResult(provider_name="second")
+
+    assert container.result is first
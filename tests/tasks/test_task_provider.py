@@ -2,11 +2,23 @@
 builtin functionality of the BaseTaskProvider is proeprly implemented.
 """
 
+import copy
+import pickle
+
 import pytest
 
 from docprompt.tasks.base import AbstractTaskProvider
 
 
+class PicklableTaskProvider(AbstractTaskProvider):
+    # Defined at module level, so pickle can look the class up by name
+    name = "PicklableTaskProvider"
+    capabilities = ["test"]
+
+    def _invoke(self, input, config=None, **kwargs):
+        return input
+
+
 class TestAbstractTaskProviderBaseFunctionliaty:
     """
     Test that the BaseTaskProvider interface provides the correct expected basic
@@ -97,3 +109,58 @@ class TestAbstractTaskProviderBaseFunctionliaty:
         provider = TestTaskProvider()
 
         assert provider.invoke([1, 2, 3]) == [1, 2, 3]
+
+    def test_invoke_merges_default_and_call_kwargs(self):
+        class TestTaskProvider(AbstractTaskProvider):
+            name = "TestTaskProvider"
+            capabilities = ["test"]
+
+            def _invoke(self, input, config=None, **kwargs):
+                kwargs["mutated"] = True
+                return kwargs
+
+        defaults = {"model_name": "default", "api_key": "key"}
+        provider = TestTaskProvider(invoke_kwargs=defaults)
+
+        assert provider.invoke([]) == {**defaults, "mutated": True}
+        assert provider.invoke([], model_name="override") == {
+            "model_name": "override",
+            "api_key": "key",
+            "mutated": True,
+        }
+        assert provider._default_invoke_kwargs == defaults
+
+    def test_invoke_without_defaults_passes_call_kwargs(self):
+        class TestTaskProvider(AbstractTaskProvider):
+            name = "TestTaskProvider"
+            capabilities = ["test"]
+
+            def _invoke(self, input, config=None, **kwargs):
+                return kwargs
+
+        provider = TestTaskProvider()
+
+        assert provider.invoke([]) == {}
+        assert provider.invoke([], model_name="override") == {"model_name": "override"}
+
+    def test_default_invoke_kwargs_are_a_copy(self):
+        class TestTaskProvider(AbstractTaskProvider):
+            name = "TestTaskProvider"
+            capabilities = ["test"]
+
+        defaults = {"api_key": "key"}
+        provider = TestTaskProvider(invoke_kwargs=defaults)
+        defaults["api_key"] = "changed"
+
+        assert provider._default_invoke_kwargs == {"api_key": "key"}
+
+    def test_pickle_round_trip_keeps_default_invoke_kwargs(self):
+        provider = PicklableTaskProvider(invoke_kwargs={"api_key": "key"})
+
+        loaded = pickle.loads(pickle.dumps(provider))
+
+        assert loaded._default_invoke_kwargs == {"api_key": "key"}
+        assert copy.deepcopy(provider)._default_invoke_kwargs == {"api_key": "key"}
+        assert provider.model_copy(deep=True)._default_invoke_kwargs == {
+            "api_key": "key"
+        }
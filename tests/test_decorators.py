@@ -206,8 +206,8 @@ def test_multiple_method_groups(run_async):
     obj = MultiGroupClass()
     assert obj.method1() == "sync1"
     assert obj.method2() == "async2"
-    # assert run_async(obj.method1_async()) == "sync1"
-    # assert run_async(obj.method2_async()) == "async2"
+    assert run_async(obj.method1_async()) == "sync1"
+    assert run_async(obj.method2_async()) == "async2"
 
 
 def test_inheritance_and_overriding(run_async):
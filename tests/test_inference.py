@@ -0,0 +1,89 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from docprompt.tasks.message import OpenAIMessage
+from docprompt.utils import inference
+
+
+def _mock_client(text: str = "response"):
+    client = MagicMock()
+    response = MagicMock()
+    response.content = [MagicMock(text=text)]
+    client.messages.create = AsyncMock(return_value=response)
+    return client
+
+
+@pytest.mark.asyncio
+async def test_run_batch_inference_anthropic_shares_one_client():
+    client = _mock_client()
+    messages = [
+        [OpenAIMessage(role="user", content="first")],
+        [OpenAIMessage(role="user", content="second")],
+    ]
+
+    with patch.object(
+        inference, "get_anthropic_client", return_value=client
+    ) as mock_get_client:
+        responses = await inference.run_batch_inference_anthropic(
+            "claude-model", messages, api_key="key"
+        )
+
+    mock_get_client.assert_called_once_with("key")
+    assert client.messages.create.await_count == 2
+    assert responses == ["response", "response"]
+
+
+@pytest.mark.asyncio
+async def test_run_batch_inference_anthropic_keeps_message_order():
+    delays = {"slow": 0.05, "fast": 0.0}
+
+    async def create(**kwargs):
+        text = kwargs["messages"][0].content
+        await asyncio.sleep(delays[text])
+        response = MagicMock()
+        response.content = [MagicMock(text=text)]
+        return response
+
+    client = MagicMock()
+    client.messages.create = create
+    messages = [
+        [OpenAIMessage(role="user", content="slow")],
+        [OpenAIMessage(role="user", content="fast")],
+    ]
+
+    with patch.object(inference, "get_anthropic_client", return_value=client):
+        responses = await inference.run_batch_inference_anthropic(
+            "claude-model", messages
+        )
+
+    assert responses == ["slow", "fast"]
+
+
+@pytest.mark.asyncio
+async def test_run_batch_inference_anthropic_bounds_concurrency():
+    in_flight = 0
+    peak = 0
+
+    async def create(**kwargs):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        response = MagicMock()
+        response.content = [MagicMock(text="response")]
+        return response
+
+    client = MagicMock()
+    client.messages.create = create
+    messages = [[OpenAIMessage(role="user", content="page")] for _ in range(10)]
+
+    with patch.object(inference, "get_anthropic_client", return_value=client):
+        responses = await inference.run_batch_inference_anthropic(
+            "claude-model", messages, max_concurrency=3
+        )
+
+    assert len(responses) == 10
+    assert peak == 3
@@ -0,0 +1,56 @@
+import io
+import random
+
+from PIL import Image
+
+from docprompt.rasterize import (
+    AspectRatioRule,
+    estimate_png_byte_size,
+    resize_image_to_closest_aspect_ratio,
+    resize_image_to_fize_size_limit,
+)
+
+
+def _noisy_image(width: int = 1000, height: int = 1000) -> Image.Image:
+    rng = random.Random(0)
+    return Image.frombytes(
+        "L", (width, height), bytes(rng.getrandbits(8) for _ in range(width * height))
+    )
+
+
+def _png_bytes(image: Image.Image) -> bytes:
+    buffer = io.BytesIO()
+    image.save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+def test_resize_to_file_size_limit__does_not_mutate_caller_image():
+    image = _noisy_image()
+    limit = estimate_png_byte_size(image) // 2
+
+    resized = resize_image_to_fize_size_limit(image, limit, resize_mode="thumbnail")
+
+    assert image.size == (1000, 1000)
+    assert resized is not image
+    assert estimate_png_byte_size(resized) < limit
+
+
+def test_resize_to_file_size_limit__from_bytes_matches_image_input():
+    image = _noisy_image()
+    limit = estimate_png_byte_size(image) // 2
+
+    from_image = resize_image_to_fize_size_limit(image, limit)
+    from_bytes = resize_image_to_fize_size_limit(_png_bytes(image), limit)
+
+    assert from_bytes.size == from_image.size
+
+
+def test_resize_to_closest_aspect_ratio__does_not_mutate_caller_image():
+    image = _noisy_image(400, 200)
+    rules = [AspectRatioRule(ratio=2.0, max_width=200, max_height=100)]
+
+    resized = resize_image_to_closest_aspect_ratio(image, rules)
+    from_bytes = resize_image_to_closest_aspect_ratio(_png_bytes(image), rules)
+
+    assert image.size == (400, 200)
+    assert resized.size == from_bytes.size == (200, 100)
@@ -3,6 +3,8 @@ import pickle
 from pytest import raises
 
 from docprompt import DocumentNode, load_document
+from docprompt.provenance.util import refine_block_to_word_level
+from docprompt.schema.layout import NormBBox, TextBlock
 
 from .fixtures import PDF_FIXTURES
 
@@ -108,3 +110,32 @@ def test_pickling__removes_locator_page_basis():
     loaded = pickle.loads(dumped)
 
     assert loaded.document._locator is None
+
+
+def test_refine_block_to_word_level__multi_word_query():
+    words = ["The", "quick", "brown", "fox", "jumps"]
+    word_blocks = [
+        TextBlock(
+            text=word,
+            type="word",
+            bounding_box=NormBBox(
+                x0=idx * 0.1, top=0.1, x1=idx * 0.1 + 0.05, bottom=0.15
+            ),
+        )
+        for idx, word in enumerate(words)
+    ]
+    source_block = TextBlock(
+        text=" ".join(words),
+        type="block",
+        bounding_box=NormBBox(x0=0, top=0.1, x1=0.45, bottom=0.15),
+    )
+
+    merged_block, matching_blocks = refine_block_to_word_level(
+        source_block=source_block,
+        intersecting_word_level_blocks=word_blocks,
+        query="quick brown fox",
+    )
+
+    assert [block.text for block in matching_blocks] == ["quick", "brown", "fox"]
+    assert merged_block.text == "quick brown fox "
+    assert merged_block.bounding_box.x0 == matching_blocks[0].bounding_box.x0
@@ -0,0 +1,20 @@
+import pytest
+
+from docprompt import load_document
+from docprompt.utils import get_page_count
+from docprompt.utils.splitter import pdf_split_iter_with_max_bytes
+from tests.fixtures import PDF_FIXTURES
+
+
+@pytest.mark.parametrize("max_bytes", [1024 * 1024 * 5 // 2, 1024 * 1024 * 20])
+def test_split_with_max_bytes__covers_every_page_once(max_bytes):
+    fixture = PDF_FIXTURES[1]
+    document = load_document(fixture.get_full_path())
+
+    batches = list(
+        pdf_split_iter_with_max_bytes(document.file_bytes, 5, max_bytes=max_bytes)
+    )
+
+    assert all(len(batch) <= max_bytes for batch in batches)
+    assert all(get_page_count(batch) <= 5 for batch in batches)
+    assert sum(get_page_count(batch) for batch in batches) == fixture.page_count
@@ -1,11 +1,13 @@
 """Test the storage wrapper for fsspec."""
 
+import os
 from unittest.mock import MagicMock, patch
 
 import fsspec
 import pytest
 from fsspec import AbstractFileSystem
 from fsspec.implementations.local import LocalFileSystem
+from pydantic import ValidationError
 
 from docprompt.storage import (
     FileSidecarsPathManager,
@@ -30,6 +32,17 @@ def test_file_sidecar_manager_paths():
     assert manager.page_metadata == f"{base_path}/{file_hash}/pages.json"
 
 
+def test_file_sidecar_manager_paths_are_cached():
+    """Test that the sidecar paths are computed once, and the manager is immutable."""
+
+    manager = FileSidecarsPathManager(base_path="/tmp/data", file_hash="example-hash")
+
+    assert manager.pdf is manager.pdf
+
+    with pytest.raises(ValidationError):
+        manager.file_hash = "other-hash"
+
+
 def test_file_system_annotation_validation():
     """Ensure that the file system custom annotation validates correctly."""
 
@@ -133,57 +146,77 @@ class TestFileSystemManager:
 
             assert result_pdf_name == "base.pdf"
 
-        def test__write_method_creates_dir(self, mock_manager):
-            """Test that the write method creates a direcrory if it does not exist."""
+        def test__sidecar_paths_match_path_manager(self, mock_manager):
+            """Test that the fast path helper matches the sidecar path manager."""
 
-            with patch.object(mock_manager.fs, "exists") as mock_exists:
-                mock_exists.return_value = False
+            path_manager = FileSidecarsPathManager(
+                base_path=mock_manager.path, file_hash="example-hash"
+            )
 
-                with patch.object(mock_manager.fs, "mkdirs") as mock_mkdir:
-                    with patch.object(mock_manager.fs, "open"):
-                        mock_manager._write(
-                            b"example-value",
-                            "/tmp/data/file.txt",
-                            "wb",
-                            example="kwarg",
-                        )
+            assert mock_manager._sidecar_paths("example-hash") == (
+                path_manager.pdf,
+                path_manager.metadata,
+                path_manager.page_metadata,
+            )
 
-            real_kwargs = {**mock_manager.fs_kwargs, "example": "kwarg"}
+        def test__write_many_method_caches_known_dirs(self):
+            """Test that repeated writes into the same directory only create it once."""
 
-            mock_exists.assert_called_once_with("/tmp/data", **real_kwargs)
-            mock_mkdir.assert_called_once_with("/tmp/data", **real_kwargs)
+            manager = FileSystemManager(url="memory://cached")
 
-        def test__write_method(self, mock_manager):
-            """Test that the `_write` implementation method works correctly."""
+            with patch.object(manager.fs, "makedirs") as mock_mkdir:
+                with patch.object(manager.fs, "pipe"):
+                    manager._write_many({"/cached/a.txt": b"a"})
+                    manager._write_many({"/cached/b.txt": b"b"})
 
-            with patch.object(mock_manager.fs, "open") as mock_open:
-                mock_file = MagicMock()
-                mock_open.return_value.__enter__.return_value = mock_file
+            mock_mkdir.assert_called_once_with("/cached", exist_ok=True)
 
-                mock_manager._write(
-                    b"example-value", "example-path", "wb", example="kwarg"
-                )
+        def test__write_many_method(self):
+            """Test that the `_write_many` method creates each directory and pipes the values at once."""
 
-            real_kwargs = {**mock_manager.fs_kwargs, "example": "kwarg"}
+            manager = FileSystemManager(url="memory://many")
+            values = {"/many/a.pdf": b"a", "/many/a.json": b"b"}
 
-            mock_open.assert_called_once_with("example-path", "wb", **real_kwargs)
-            mock_file.write.assert_called_once_with(b"example-value")
+            with patch.object(manager.fs, "makedirs") as mock_mkdir:
+                with patch.object(manager.fs, "pipe") as mock_pipe:
+                    manager._write_many(values, example="kwarg")
 
-        def test__read_method(self, mock_manager):
-            """Test that the `_read` implementation method works correctly."""
+            real_kwargs = {**manager.fs_kwargs, "example": "kwarg"}
 
-            with patch.object(mock_manager.fs, "open") as mock_open:
-                mock_file = MagicMock()
-                mock_file.read.return_value = b"example-value"
-                mock_open.return_value.__enter__.return_value = mock_file
+            mock_mkdir.assert_called_once_with("/many", exist_ok=True)
+            mock_pipe.assert_called_once_with(values, **real_kwargs)
 
-                result = mock_manager._read("example-path", "rb", example="kwarg")
+        def test__write_many_method_replaces_local_files(self, tmp_path):
+            """Test that local files are moved into place rather than written in place."""
 
-            real_kwargs = {**mock_manager.fs_kwargs, "example": "kwarg"}
+            manager = FileSystemManager(url=str(tmp_path))
+            target = tmp_path / "sidecar" / "base.pdf"
+
+            manager._write_many({str(target): b"old"})
+
+            with patch(
+                "docprompt.storage.os.replace", wraps=os.replace
+            ) as mock_replace:
+                manager._write_many({str(target): b"new"})
+
+            mock_replace.assert_called_once()
+            assert target.read_bytes() == b"new"
+            assert os.listdir(target.parent) == ["base.pdf"]
 
-            mock_open.assert_called_once_with("example-path", "rb", **real_kwargs)
-            mock_file.read.assert_called_once()
-            assert result == b"example-value"
+        def test__write_many_method_recreates_removed_local_dirs(self, tmp_path):
+            """Test that a local sidecar directory removed between writes is created again."""
+
+            manager = FileSystemManager(url=str(tmp_path))
+            target = tmp_path / "sidecar" / "base.pdf"
+
+            manager._write_many({str(target): b"old"})
+
+            target.unlink()
+            target.parent.rmdir()
+
+            manager._write_many({str(target): b"new"})
+
+            assert target.read_bytes() == b"new"
 
         @pytest.mark.parametrize("exists", [True, False])
         def test__delete_method(self, mock_manager, exists):
@@ -191,14 +224,15 @@ class TestFileSystemManager:
 
             with patch.object(mock_manager.fs, "exists") as mock_exists:
                 with patch.object(mock_manager.fs, "rm") as mock_rm:
-                    mock_exists.return_value = exists
+                    if not exists:
+                        mock_rm.side_effect = FileNotFoundError
+
                     mock_manager._delete("example-path", example="kwarg")
 
             real_kwargs = {**mock_manager.fs_kwargs, "example": "kwarg"}
 
-            mock_exists.assert_called_once_with("example-path", **real_kwargs)
-            if exists:
-                mock_rm.assert_called_once_with("example-path", **real_kwargs)
+            mock_exists.assert_not_called()
+            mock_rm.assert_called_once_with("example-path", **real_kwargs)
 
         def test_write_method_no_metadata(self, mock_manager):
             """Test that the write method works correclty when no metadata is provided."""
@@ -207,11 +241,15 @@ class TestFileSystemManager:
             example_hash = hash_from_bytes(example_bytes)
             expected_path = f"/tmp/data/{example_hash}/base.pdf"
 
-            with patch.object(mock_manager, "_write") as mock_write:
-                result = mock_manager.write(b"example-value", example="kwarg")
+            with patch.object(mock_manager, "_write_many") as mock_write:
+                with patch.object(mock_manager, "_delete_many") as mock_delete:
+                    result = mock_manager.write(b"example-value", example="kwarg")
 
             mock_write.assert_called_once_with(
-                example_bytes, expected_path, "wb", example="kwarg"
+                {expected_path: example_bytes}, example="kwarg"
+            )
+            mock_delete.assert_called_once_with(
+                [result.metadata, result.page_metadata], example="kwarg"
             )
             assert result.pdf == expected_path
 
@@ -227,30 +265,44 @@ class TestFileSystemManager:
             expected_metadata_path = f"/tmp/data/{example_hash}/base.json"
             expected_page_metadata_path = f"/tmp/data/{example_hash}/pages.json"
 
-            with patch.object(mock_manager, "_write") as mock_write:
-                result = mock_manager.write(
-                    example_bytes,
-                    example_metadata_bytes,
-                    example_page_metadata_bytes,
-                    example="kwarg",
-                )
+            with patch.object(mock_manager, "_write_many") as mock_write:
+                with patch.object(mock_manager, "_delete_many") as mock_delete:
+                    result = mock_manager.write(
+                        example_bytes,
+                        example_metadata_bytes,
+                        example_page_metadata_bytes,
+                        example="kwarg",
+                    )
 
-            mock_write.assert_any_call(
-                example_bytes, expected_path, "wb", example="kwarg"
-            )
-            mock_write.assert_any_call(
-                example_metadata_bytes, expected_metadata_path, "wb", example="kwarg"
-            )
-            mock_write.assert_any_call(
-                example_page_metadata_bytes,
-                expected_page_metadata_path,
-                "wb",
+            mock_write.assert_called_once_with(
+                {
+                    expected_path: example_bytes,
+                    expected_metadata_path: example_metadata_bytes,
+                    expected_page_metadata_path: example_page_metadata_bytes,
+                },
                 example="kwarg",
             )
+            mock_delete.assert_called_once_with([], example="kwarg")
             assert result.pdf == expected_path
             assert result.metadata == expected_metadata_path
             assert result.page_metadata == expected_page_metadata_path
 
+        def test__read_many_method(self, mock_manager):
+            """Test that the `_read_many` method reads every path in a single `cat` call."""
+
+            paths = ["/tmp/data/a.pdf", "/tmp/data/a.json"]
+            missing = FileNotFoundError("/tmp/data/a.json")
+
+            with patch.object(mock_manager.fs, "cat") as mock_cat:
+                mock_cat.return_value = {paths[0]: b"example-value", paths[1]: missing}
+
+                result = mock_manager._read_many(paths, example="kwarg")
+
+            real_kwargs = {**mock_manager.fs_kwargs, "example": "kwarg"}
+
+            mock_cat.assert_called_once_with(paths, on_error="return", **real_kwargs)
+            assert result == {paths[0]: b"example-value", paths[1]: missing}
+
         def test_read_method_no_metadata(self, mock_manager):
             """Test that the read method works correctly when no metadata is provided."""
 
@@ -260,28 +312,39 @@ class TestFileSystemManager:
             expected_metadata_path = f"/tmp/data/{example_hash}/base.json"
             expected_page_metadata_path = f"/tmp/data/{example_hash}/pages.json"
 
-            with patch.object(mock_manager, "_read") as mock_read:
-                mock_read.side_effect = [
-                    example_bytes,
-                    FileNotFoundError,
-                    FileNotFoundError,
-                ]
+            with patch.object(mock_manager, "_read_many") as mock_read:
+                mock_read.return_value = {
+                    expected_path: example_bytes,
+                    expected_metadata_path: FileNotFoundError(),
+                    expected_page_metadata_path: FileNotFoundError(),
+                }
 
-                mock_read.return_value = example_bytes
                 pdf, metadata, page_metadata = mock_manager.read(
                     example_hash, example="kwarg"
                 )
 
-            mock_read.assert_any_call(expected_path, "rb", example="kwarg")
-            mock_read.assert_any_call(expected_metadata_path, "rb", example="kwarg")
-            mock_read.assert_any_call(
-                expected_page_metadata_path, "rb", example="kwarg"
+            mock_read.assert_called_once_with(
+                [expected_path, expected_metadata_path, expected_page_metadata_path],
+                example="kwarg",
             )
 
             assert pdf == example_bytes
             assert metadata is None
             assert page_metadata is None
 
+        def test_read_method_missing_pdf(self, mock_manager):
+            """Test that the read method raises when the PDF itself is missing."""
+
+            with patch.object(mock_manager, "_read_many") as mock_read:
+                mock_read.return_value = {
+                    "/tmp/data/example-hash/base.pdf": FileNotFoundError(),
+                    "/tmp/data/example-hash/base.json": FileNotFoundError(),
+                    "/tmp/data/example-hash/pages.json": FileNotFoundError(),
+                }
+
+                with pytest.raises(FileNotFoundError):
+                    mock_manager.read("example-hash")
+
         def test_read_method_w_metadata(self, mock_manager):
             """Test that the read method works correctly when metadata is provided."""
 
@@ -294,23 +357,79 @@ class TestFileSystemManager:
             expected_metadata_path = f"/tmp/data/{example_hash}/base.json"
             expected_page_metadata_path = f"/tmp/data/{example_hash}/pages.json"
 
-            with patch.object(mock_manager, "_read") as mock_read:
-                mock_read.side_effect = [
-                    example_bytes,
-                    example_metadata_bytes,
-                    example_page_metadata_bytes,
-                ]
+            with patch.object(mock_manager, "_read_many") as mock_read:
+                mock_read.return_value = {
+                    expected_path: example_bytes,
+                    expected_metadata_path: example_metadata_bytes,
+                    expected_page_metadata_path: example_page_metadata_bytes,
+                }
 
                 pdf, metadata, page_metadata = mock_manager.read(
                     example_hash, example="kwarg"
                 )
 
-            mock_read.assert_any_call(expected_path, "rb", example="kwarg")
-            mock_read.assert_any_call(expected_metadata_path, "rb", example="kwarg")
-            mock_read.assert_any_call(
-                expected_page_metadata_path, "rb", example="kwarg"
+            mock_read.assert_called_once_with(
+                [expected_path, expected_metadata_path, expected_page_metadata_path],
+                example="kwarg",
             )
 
             assert pdf == example_bytes
             assert metadata == example_metadata_bytes
             assert page_metadata == example_page_metadata_bytes
+
+
+@pytest.mark.asyncio
+async def test_file_system_manager_async_round_trip(tmp_path):
+    """Test that the async write and read methods round-trip the sidecars."""
+
+    manager = FileSystemManager(url=str(tmp_path))
+
+    path_manager = await manager.awrite(b"example-value", b"example-metadata")
+
+    pdf, metadata, page_metadata = await manager.aread(path_manager.file_hash)
+
+    assert pdf == b"example-value"
+    assert metadata == b"example-metadata"
+    assert page_metadata is None
+
+
+def test_file_system_manager_many_round_trip(tmp_path):
+    """Test that many documents are written in size-capped batches and read back in order."""
+
+    manager = FileSystemManager(url=str(tmp_path))
+
+    items = [
+        (b"first-pdf", b"first-metadata", None),
+        (b"second-pdf", None, b"second-page-metadata"),
+        (b"third-pdf", None, None),
+    ]
+
+    with patch.object(manager, "_write_many", wraps=manager._write_many) as mock_write:
+        path_managers = manager.write_many(items, max_batch_bytes=40)
+
+    assert mock_write.call_count == 2
+    assert [pm.file_hash for pm in path_managers] == [
+        hash_from_bytes(pdf) for pdf, _, _ in items
+    ]
+
+    results = manager.read_many([pm.file_hash for pm in path_managers])
+
+    assert results == items
+
+
+def test_file_system_manager_many_keeps_sidecars_written_by_later_items(tmp_path):
+    """Test that a sidecar cleared by one item and written by a later one is kept."""
+
+    manager = FileSystemManager(url=str(tmp_path))
+
+    items = [
+        (b"same-pdf", None, None),
+        (b"same-pdf", b"metadata", None),
+    ]
+
+    with patch.object(manager.fs, "rm", wraps=manager.fs.rm) as mock_rm:
+        path_managers = manager.write_many(items)
+
+    assert mock_rm.call_args_list[0].args == ([path_managers[1].page_metadata],)
+
+    assert manager.read(path_managers[1].file_hash) == (b"same-pdf", b"metadata", None)